@@ -30,7 +30,7 @@ def main():
     parser = argparse.ArgumentParser(description="Test runner for ContentGraph MCP")
     parser.add_argument(
         "--mode", 
-        choices=["unit", "integration", "all", "coverage", "fast"], 
+        choices=["unit", "integration", "all", "coverage", "fast", "quick"], 
         default="all",
         help="Test mode to run"
     )
@@ -74,6 +74,11 @@ def main():
         cmd = base_cmd + ["--no-cov"]
         success = run_command(cmd, "Running fast tests (no coverage)")
     
+    elif args.mode == "quick":
+        # Skip model- and database-heavy tests for a tight edit/test loop
+        cmd = base_cmd + ["--no-cov", "-m", "not slow"]
+        success = run_command(cmd, "Running quick tests (no coverage, skipping slow tests)")
+    
     elif args.mode == "coverage":
         # Run tests with detailed coverage
         cmd = base_cmd + [
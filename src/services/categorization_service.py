@@ -1,3 +1,4 @@
+import asyncio
 import os
 import time
 import hashlib
@@ -12,6 +13,14 @@ class CategoryResults(BaseModel):
     tags: List[str] = Field(..., description="List of relevant tags related to the content.")
     summary: str = Field(..., description="A short summary of the content.")
     
+# Kept byte-identical across requests so the provider can reuse its cached prompt prefix;
+# per-request content goes only in the trailing user message.
+CATEGORIZATION_INSTRUCTIONS = """Analyze the given content and provide:
+1. A general category (e.g Technology, Science, Business, etc.)
+2. Confidence score between 0-1 (float)
+3. 3 to 5 relevant tags (e.g., Machine Learning, Python, etc.)
+4. A short summary that gives a brief overview of the content."""
+
 class CategorizationService:
     """A categorization service that uses AI to categorize content.
     Integrates with OpenAI via instructor."""
@@ -27,47 +36,85 @@ class CategorizationService:
     
     def _generate_cache_key(self, title: str, content: str) -> str:
         """Create a unique cache key based on title and content."""
-        return hashlib.blake2b((title + content).encode("utf-8")).hexdigest()
-    def categorize_content(self, title: str, content: str, max_retries: int = 3, retry_delay: int = 2) -> CategoryResults: 
-        """Categorize content using LLM"""
+        # Hash the parts incrementally instead of concatenating a second copy of a long
+        # content string; the separator keeps ("ab", "c") and ("a", "bc") distinct.
+        digest = hashlib.blake2b(title.encode("utf-8"), digest_size=16)
+        digest.update(b"\x00")
+        digest.update(content.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _build_messages(self, title: str, content: str) -> List[dict]:
+        """Build the chat messages: the fixed instructions first, the content last."""
+        return [
+            {"role": "system", "content": CATEGORIZATION_INSTRUCTIONS},
+            {"role": "user", "content": f"Title: {title}\nContent:\n{content}"},
+        ]
+
+    def _lookup(self, title: str, content: str) -> tuple:
+        """Validate the input and return (cache_key, cached result or None)."""
         if not content.strip():
             raise ValueError("Cannot categorize empty content.")
         
         cache_key = self._generate_cache_key(title, content)
         if self.cache_enabled and cache_key in self._cache:
-            return self._cache[cache_key]
-        
-        prompt = f"""
-        Analyze the given content and provide: 
-        1. A general category (e.g Technology, Science, Business, etc.)
-        2. Confidence score between 0-1 (float)
-        3. 3 to 5 relevant tags (e.g., Machine Learning, Python, etc.)
-        4. A short summary that gives a brief overview of the content. 
+            return cache_key, self._cache[cache_key]
+        return cache_key, None
+
+    def _request_kwargs(self, title: str, content: str) -> dict:
+        """Arguments for the completion request shared by the sync and async paths."""
+        return {
+            "model": "gpt-4o-mini",
+            "messages": self._build_messages(title, content),
+            "response_model": CategoryResults,
+        }
+
+    def _remember(self, cache_key: str, result: CategoryResults) -> CategoryResults:
+        """Cache a fresh result when caching is enabled and return it."""
+        if self.cache_enabled:
+            self._cache[cache_key] = result
+        return result
+
+    @staticmethod
+    def _raise_unless_retryable(error: Exception, attempt: int, max_retries: int) -> None:
+        """Return if the failed attempt should be retried, otherwise raise it as a RuntimeError."""
+        if isinstance(error, (RateLimitError, APITimeoutError)):
+            if attempt < max_retries:
+                return
+            raise RuntimeError(f"Retry limit reached. Failed due to transient error: {str(error)}")
+        if isinstance(error, APIError):
+            raise RuntimeError(f"API Error occurred: {str(error)}")
+        raise RuntimeError(f"Unexpected error occurred: {str(error)}")
+
+    def categorize_content(self, title: str, content: str, max_retries: int = 3, retry_delay: int = 2) -> CategoryResults: 
+        """Categorize content using LLM"""
+        cache_key, cached = self._lookup(title, content)
+        if cached is not None:
+            return cached
         
-        Title: {title}
-        Content : 
-        {content}
-        """ 
+        request = self._request_kwargs(title, content)
+        for attempt in range(1, max_retries + 1):
+            try:
+                result = self.client.chat.completions.create(**request)
+            except Exception as e:
+                self._raise_unless_retryable(e, attempt, max_retries)
+                time.sleep(retry_delay)
+                continue
+            return self._remember(cache_key, result)
+
+    async def categorize_content_async(self, title: str, content: str, max_retries: int = 3, retry_delay: int = 2) -> CategoryResults:
+        """Categorize content using LLM without blocking the event loop.
+        The request runs in a worker thread and retry waits use asyncio.sleep,
+        so concurrent callers overlap their backoff instead of queueing behind it."""
+        cache_key, cached = self._lookup(title, content)
+        if cached is not None:
+            return cached
         
+        request = self._request_kwargs(title, content)
         for attempt in range(1, max_retries + 1):
             try:
-                result = self.client.chat.completions.create(
-                    model="gpt-4o-mini", 
-                    messages=[{"role": "user", "content": prompt}], 
-                    response_model=CategoryResults
-                )
-                if self.cache_enabled:
-                    self._cache[cache_key] = result
-                
-                return result
-            
-            except (RateLimitError, APITimeoutError) as e:
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
-                    continue
-                else:
-                    raise RuntimeError(f"Retry limit reached. Failed due to transient error: {str(e)}")
-            except APIError as e:
-                raise RuntimeError(f"API Error occurred: {str(e)}")
+                result = await asyncio.to_thread(self.client.chat.completions.create, **request)
             except Exception as e:
-                raise RuntimeError(f"Unexpected error occurred: {str(e)}")
\ No newline at end of file
+                self._raise_unless_retryable(e, attempt, max_retries)
+                await asyncio.sleep(retry_delay)
+                continue
+            return self._remember(cache_key, result)
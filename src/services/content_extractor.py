@@ -1,48 +1,134 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound
 from urllib.parse import urlparse
-import re
 from requests.exceptions import RequestException, Timeout, ConnectionError, HTTPError
 
 from src.core.exceptions import URLFormatException, NullContentException, InvalidContentException, MetadataExtractionException
 
 
+# Pages are read in chunks and truncated past this size to keep memory bounded
+_MAX_RESPONSE_BYTES = 5_000_000
+_CHUNK_SIZE = 64 * 1024
+
+# Seconds to wait for a connection or a response before giving up
+_REQUEST_TIMEOUT = 10
+
+# Number of parsed pages remembered by body hash
+_PARSE_CACHE_SIZE = 512
+
+# Title reported when a page has no <title> element
+_NO_TITLE = "No title Found"
+
+# Page chrome that never belongs to the main content, removed in one tree walk
+_BOILERPLATE_TAGS = ['nav', 'aside', 'footer', 'noscript']
+
+
+@lru_cache(maxsize=4096)
+def _domain_for(url: str) -> str:
+    """Return the network location of a URL, memoized for repeated URLs."""
+    return urlparse(url).netloc
+
+
+def _read_capped(response) -> bytes:
+    """Read a streamed response body, stopping once it exceeds _MAX_RESPONSE_BYTES."""
+    chunks = []
+    total = 0
+    for chunk in response.iter_content(_CHUNK_SIZE):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= _MAX_RESPONSE_BYTES:
+            break
+    return b"".join(chunks)[:_MAX_RESPONSE_BYTES]
+
+
+def _parse_html(markup) -> BeautifulSoup:
+    """Parse HTML with the C-based lxml parser, falling back to html.parser if it is missing."""
+    try:
+        return BeautifulSoup(markup, 'lxml')
+    except FeatureNotFound:
+        return BeautifulSoup(markup, 'html.parser')
+
+
 class ContentExtractor:
     def __init__(self):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        # One pooled session per extractor keeps connections alive across requests.
+        # raise_on_status=False hands the last retried response back so that
+        # raise_for_status() still reports it as an HTTP error. read=False stops a
+        # stalled server from being retried and surfaces it as a plain timeout.
+        retries = Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retries)
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # requests advertises br alongside gzip/deflate once brotli is installed
+        self._session.headers.update(self.headers)
+        # Parsed (title, content, metadata) keyed by a hash of the page body, so
+        # re-crawled pages that have not changed skip HTML parsing entirely.
+        self._parse_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+    def _parse_page(self, body: bytes) -> tuple:
+        """Parse a page body into (title, content, metadata), reusing earlier results for identical bodies."""
+        key = hashlib.blake2b(body, digest_size=16).digest()
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(key)
+            if cached is not None:
+                self._parse_cache.move_to_end(key)
+                return cached
+        
+        soup = _parse_html(body)
+        
+        title = soup.find('title')
+        title = title.text.strip() if title else _NO_TITLE
+        
+        content = self._extract_main_content(soup)
+        
+        metadata = self._extract_metadata(soup)
+        parsed = (title, content, metadata)
+        with self._parse_cache_lock:
+            self._parse_cache[key] = parsed
+            if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return parsed
     def extract_from_url(self, url: str) -> dict:
         """Extract content from a given URL."""
         if not url:
             raise URLFormatException(message=f"Invalid URL format. The URL cannot be empty. It needs to be of format http://<URL> or https://<URL> but got {url}")
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            with self._session.get(url, timeout=_REQUEST_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                body = _read_capped(response)
             
-            if not response.content:
+            if not body:
                 return {
-                    "title": "No title Found",
+                    "title": _NO_TITLE,
                     "content": "",
                     "url": url,
-                    "domain": urlparse(url).netloc,
+                    "domain": _domain_for(url),
                     "metadata": {"type": "empty"}
                 }
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            title = soup.find('title')
-            title = title.text.strip() if title else "No title Found"
-            
-            content = self._extract_main_content(soup)
-            
-            metadata = self._extract_metadata(soup)
+            title, content, metadata = self._parse_page(body)
             return {
                 "title": title,
                 "content": content,
                 "url": url,
-                "domain": urlparse(url).netloc,
-                "metadata": metadata,
+                "domain": _domain_for(url),
+                "metadata": dict(metadata),
             }
         except UnicodeDecodeError:
                         raise InvalidContentException(message="Invalid content encoding. Unable to decode the content from the URL.")
@@ -60,8 +146,10 @@ class ContentExtractor:
         """Extract the main readable content from HTML."""
         if not soup:
             raise NullContentException(message="The provided HTML content is Null or empty")
-        for script in soup(["script", "style"]):
-            script.decompose()
+        # No need to strip <script>/<style> first: bs4 parses their bodies into
+        # Script/Stylesheet strings, which get_text() already leaves out.
+        for tag in soup.find_all(_BOILERPLATE_TAGS):
+            tag.decompose()
         content_selectors = [
             'article', '.content', '.post-content',
             '.main-content', '.entry-content', 'main'
@@ -74,13 +162,16 @@ class ContentExtractor:
         return self.clean_text(soup.get_text())
     def _extract_metadata(self, soup):
         """Extract metadata like author and date."""
+        metas = {}
+        for meta in soup.find_all("meta"):
+            key = meta.get("name") or meta.get("property")
+            if key and key not in metas:
+                metas[key] = meta.get("content")
         metadata = {}
-        author = soup.find("meta", attrs={"name": "author"})
-        if author and author.get("content"):
-            metadata["author"] = author["content"]
-        date = soup.find("meta", attrs={"property": "article:published_time"})
-        if date and date.get("content"):
-            metadata["date"] = date["content"]
+        if metas.get("author"):
+            metadata["author"] = metas["author"]
+        if metas.get("article:published_time"):
+            metadata["date"] = metas["article:published_time"]
         if not metadata:
             raise MetadataExtractionException(message="Error extracting metadata. No metadata found in the content.")
 
@@ -104,8 +195,7 @@ class ContentExtractor:
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text."""
-        text = re.sub(r'\s+', ' ', text)  
-        return text.strip()
+        return " ".join(text.split())
     def clean_code(self, code: str) -> str:
         """Clean code blocks (strip extra whitespace)."""
         return code.strip()
@@ -11,8 +11,11 @@ This service provides high-level operations that coordinate:
 It implements retry logic, error handling, and transaction-like behavior for complex operations.
 """
 
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 from datetime import datetime
 from uuid import uuid4
 import asyncio
@@ -34,6 +37,45 @@ from src.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Number of stored records remembered for repeated store requests
+_STORE_CACHE_SIZE = 256
+
+# Upper bound on concurrent page fetches during bulk storage
+_MAX_EXTRACTION_WORKERS = 16
+
+# Number of pages extracted, embedded and stored together during bulk storage
+_BULK_BATCH_SIZE = 32
+
+# Supported quiz types and the QuizService method that generates each one
+_QUIZ_GENERATORS = {
+    "mcq": "generate_mcq_quiz",
+    "fill_in_blank": "generate_fill_in_blank_quiz",
+    "true_false": "generate_true_false_quiz",
+}
+
+
+def _url_cache_key(url: str, custom_category: Optional[str], custom_tags: Optional[List[str]]) -> Tuple:
+    """Key identifying a URL store request in the stored-record cache."""
+    return ("url", url, custom_category, tuple(custom_tags) if custom_tags is not None else None)
+
+
+def _chunked(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Yield consecutive slices of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _to_list(embedding: Any) -> List[float]:
+    """Convert an embedding row (numpy array or sequence) to a list of floats."""
+    return embedding.tolist() if hasattr(embedding, "tolist") else list(embedding)
+
+
+def _split_tags(tags: Any) -> List[str]:
+    """Turn tags stored as a comma-separated string back into a list."""
+    if isinstance(tags, str):
+        return [tag.strip() for tag in tags.split(',') if tag.strip()]
+    return list(tags)
+
 
 class ContentManagerException(Exception):
     """Base exception for ContentManager operations."""
@@ -72,18 +114,222 @@ class ContentManager:
         """
         Initialize the ContentManager with all required services.
         
+        The embedding model, vector database and quiz client are created on
+        first use, so code paths that never touch them skip their startup cost.
+        
         Args:
             openai_api_key: API key for OpenAI services
             chroma_db_path: Path to ChromaDB persistent storage
             embedding_model: Model to use for generating embeddings
         """
+        self._openai_api_key = openai_api_key
+        self._chroma_db_path = chroma_db_path
+        self._embedding_model = embedding_model
+        
         self.content_extractor = ContentExtractor()
-        self.embedding_service = EmbeddingService(model_name=embedding_model)
         self.categorization_service = CategorizationService(api_key=openai_api_key)
-        self.vector_database = VectorDatabase(persist_directory=chroma_db_path)
-        self.quiz_service = QuizService(api_key=openai_api_key)
+        self._embedding_service: Optional[EmbeddingService] = None
+        self._vector_database: Optional[VectorDatabase] = None
+        self._quiz_service: Optional[QuizService] = None
+        self._store_cache: "OrderedDict[Tuple, ContentRecord]" = OrderedDict()
+        # (database, generation) the remembered records were stored under
+        self._store_cache_owner: Tuple[Optional[VectorDatabase], Optional[int]] = (None, None)
         
-        logger.info("ContentManager initialized with all services")
+        logger.info("ContentManager initialized; embedding, vector database and quiz services load on first use")
+    
+    @property
+    def embedding_service(self) -> EmbeddingService:
+        """Embedding service, loading the model on first access."""
+        if self._embedding_service is None:
+            self._embedding_service = EmbeddingService(model_name=self._embedding_model)
+        return self._embedding_service
+    
+    @embedding_service.setter
+    def embedding_service(self, value: EmbeddingService) -> None:
+        """Replace the embedding service with an already constructed one."""
+        self._embedding_service = value
+    
+    @property
+    def vector_database(self) -> VectorDatabase:
+        """Vector database, opening the persistent store on first access."""
+        if self._vector_database is None:
+            self._vector_database = VectorDatabase(persist_directory=self._chroma_db_path)
+        return self._vector_database
+    
+    @vector_database.setter
+    def vector_database(self, value: VectorDatabase) -> None:
+        """Replace the vector database with an already constructed one."""
+        self._vector_database = value
+    
+    @property
+    def quiz_service(self) -> QuizService:
+        """Quiz service, created on first access."""
+        if self._quiz_service is None:
+            self._quiz_service = QuizService(api_key=self._openai_api_key)
+        return self._quiz_service
+    
+    @quiz_service.setter
+    def quiz_service(self, value: QuizService) -> None:
+        """Replace the quiz service with an already constructed one."""
+        self._quiz_service = value
+    
+    def _sync_store_cache(self) -> None:
+        """Forget remembered records once the vector database is replaced or cleared."""
+        database = self._vector_database
+        generation = database.generation if database is not None else None
+        owner, owner_generation = self._store_cache_owner
+        if owner is not database or owner_generation != generation:
+            self._store_cache.clear()
+            self._store_cache_owner = (database, generation)
+    
+    def _get_stored_record(self, key: Tuple) -> Optional[ContentRecord]:
+        """Return a copy of the record produced by an identical earlier store request, if remembered."""
+        self._sync_store_cache()
+        record = self._store_cache.get(key)
+        if record is None:
+            return None
+        self._store_cache.move_to_end(key)
+        return record.model_copy()
+    
+    def _remember_stored_record(self, key: Tuple, record: ContentRecord) -> None:
+        """Remember a stored record, evicting the least recently used entry when full."""
+        self._sync_store_cache()
+        self._store_cache[key] = record.model_copy()
+        self._store_cache.move_to_end(key)
+        if len(self._store_cache) > _STORE_CACHE_SIZE:
+            self._store_cache.popitem(last=False)
+    
+    def _build_content_record(
+        self,
+        extracted: Dict[str, Any],
+        content_type: str,
+        title: str,
+        category: str,
+        summary: str,
+        tags: List[str],
+        embedding: List[float],
+        source_url: Optional[str] = None
+    ) -> ContentRecord:
+        """
+        Build the ContentRecord, including its metadata, for extracted content.
+        
+        Args:
+            extracted: Extractor output holding ``content`` and optional ``metadata``
+            content_type: Type of the content (url, text, ...)
+            title: Title of the content
+            category: Resolved category
+            summary: Summary of the content
+            tags: Resolved tags
+            embedding: Embedding of the content
+            source_url: Source URL, if any
+            
+        Returns:
+            ContentRecord: The record ready for storage
+        """
+        raw_metadata = extracted.get("metadata", {})
+        metadata = ContentMetadata(
+            title=title,
+            author=raw_metadata.get("author", "Unknown"),
+            abstract=raw_metadata.get("abstract", ""),
+            keywords=raw_metadata.get("keywords", []),
+            date_published=raw_metadata.get("date_published", datetime.now())
+        )
+        return ContentRecord(
+            original_content=extracted.get("content", ""),
+            content_type=content_type,
+            title=title,
+            category=category,
+            summary=summary,
+            tags=tags,
+            embedding=embedding,
+            timestamp=datetime.now(),
+            source_url=source_url,
+            metadata=metadata
+        )
+    
+    def _extract_url_content(self, url: str) -> Dict[str, Any]:
+        """
+        Extract content from a URL and check that it is usable.
+        
+        Args:
+            url: URL to extract content from
+            
+        Returns:
+            Dict with the extracted title, content and metadata
+            
+        Raises:
+            ContentStorageException: If extraction fails or yields no content
+        """
+        extracted_content = self.content_extractor.extract_from_url(url)
+        if not isinstance(extracted_content, dict):
+            raise ContentStorageException("Content extraction failed: Invalid content format")
+        if extracted_content.get("error"):
+            raise ContentStorageException(f"Content extraction failed: {extracted_content['error']}")
+        if not (extracted_content.get("content") or "").strip():
+            raise ContentStorageException("No content extracted")
+        return extracted_content
+    
+    def _categorize(
+        self,
+        extracted: Dict[str, Any],
+        custom_category: Optional[str] = None,
+        custom_tags: Optional[List[str]] = None
+    ) -> Tuple[str, str, List[str]]:
+        """
+        Resolve the category, summary and tags for extracted content.
+        
+        The AI categorization call is skipped entirely when a custom category is
+        given; the summary then falls back to the start of the content.
+        
+        Args:
+            extracted: Extracted content dict
+            custom_category: Optional category override
+            custom_tags: Optional tags to add to content
+            
+        Returns:
+            Tuple of (category, summary, tags)
+        """
+        if custom_category is not None:
+            tags = custom_tags if custom_tags is not None else []
+            return custom_category, extracted.get("content", "")[:200], tags
+        
+        cat_result = self.categorization_service.categorize_content(extracted)
+        tags = custom_tags if custom_tags is not None else cat_result.get('tags', [])
+        return cat_result.get('category'), cat_result.get("summary", ""), tags
+    
+    def _create_url_record(
+        self,
+        url: str,
+        extracted_content: Dict[str, Any],
+        embedding: List[float],
+        custom_category: Optional[str] = None,
+        custom_tags: Optional[List[str]] = None
+    ) -> ContentRecord:
+        """
+        Categorize extracted URL content and build its ContentRecord.
+        
+        Args:
+            url: Source URL of the content
+            extracted_content: Output of _extract_url_content
+            embedding: Embedding of the content
+            custom_category: Optional category override
+            custom_tags: Optional tags to add to content
+            
+        Returns:
+            ContentRecord: The record ready for storage
+        """
+        category, summary, tags = self._categorize(extracted_content, custom_category, custom_tags)
+        
+        return self._build_content_record(
+            extracted_content,
+            content_type="url",
+            title=extracted_content.get("title", "No Title"),
+            category=category,
+            summary=summary,
+            tags=tags,
+            embedding=embedding,
+            source_url=url
+        )
     
     @retry(
         stop=stop_after_attempt(3),
@@ -118,69 +364,33 @@ class ContentManager:
         """
         logger.info(f"Starting content storage workflow for URL: {url}")
         
+        cache_key = _url_cache_key(url, custom_category, custom_tags)
+        cached_record = self._get_stored_record(cache_key)
+        if cached_record is not None:
+            logger.info(f"Content from URL already stored: {url}")
+            return cached_record
+        
         try:
             # Step 1: Extract content
             logger.debug("Extracting content from URL")
-            # Implement content extraction logic
-            extracted_content = self.content_extractor.extract_from_url(url)
-            if not isinstance(extracted_content, dict):
-                raise ContentStorageException("Content extraction failed: Invalid content format")
-            if extracted_content.get("error"):
-                raise ContentStorageException(f"Content extraction failed: {extracted_content['error']}")
-            title = extracted_content.get("title", "No Title")
-            content_text = (extracted_content.get("content") or "").strip()
-            if not content_text:
-                raise ContentStorageException("No content extracted")
+            extracted_content = self._extract_url_content(url)
 
             # Step 2: Generate embedding
             logger.debug("Generating embedding for content")
             # Implement embedding generation logic
             embedding = self.embedding_service.generate_embedding(extracted_content)
 
-            # Step 3: Categorize content
-            logger.debug("Categorizing content with AI")
-            # Implement categorization logic with AI and handle custom_category
-            cat_result = self.categorization_service.categorize_content(extracted_content)
-            if custom_category is not None:
-                category = custom_category
-                tags = custom_tags if custom_tags is not None else []
-            else:
-                category = cat_result.get('category')
-                tags = custom_tags if custom_tags is not None else cat_result.get('tags', [])
-            summary = cat_result.get("summary", "")
-            
-            # Step 4: Create metadata
-            logger.debug("Creating content metadata")
-            # Implement metadata extraction logic
-            raw_metadata = extracted_content.get("metadata", {})
-            metadata = ContentMetadata(
-                title=title,
-                author=raw_metadata.get("author", "Unknown"),
-                abstract=raw_metadata.get("abstract", ""),
-                keywords=raw_metadata.get("keywords", []),
-                date_published=raw_metadata.get("date_published", datetime.now())
-            )
-            # Step 5: Create content record
-            # Implement ContentRecord creation logic
-            logger.debug("Creating content record")
-            record = extracted_content.get("content", "")
-            content_record = ContentRecord(
-                original_content=record,
-                content_type="url",
-                title=title,
-                category=category,
-                summary=summary,
-                tags=tags,
-                embedding=embedding,
-                timestamp=datetime.now(),
-                source_url=url,
-                metadata=metadata
+            # Step 3: Categorize content and create content record with metadata
+            logger.debug("Categorizing content and creating content record")
+            content_record = self._create_url_record(
+                url, extracted_content, embedding, custom_category, custom_tags
             )
-            # Step 6: Store in vector database
+            # Step 4: Store in vector database
             logger.debug("Storing content in vector database")
             # Implement vector_database.store() method
             self.vector_database.store(content_record)
             
+            self._remember_stored_record(cache_key, content_record)
             logger.info(f"Successfully stored content from URL: {url}")
             # return the created content_record
             return content_record
@@ -221,6 +431,17 @@ class ContentManager:
         """
         logger.info("Starting content storage workflow for text input")
         
+        cache_key = (
+            "text",
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest(),
+            custom_category,
+            tuple(custom_tags) if custom_tags is not None else None
+        )
+        cached_record = self._get_stored_record(cache_key)
+        if cached_record is not None:
+            logger.info("Text content already stored")
+            return cached_record
+        
         try:
             # Step 1: Extract/clean text
             logger.debug("Extracting/cleaning text")
@@ -237,47 +458,24 @@ class ContentManager:
             # Step 3: Categorize
             logger.debug("Categorizing text with AI")
             # Implement categorization logic with AI and handle custom_category
-            cat_result = self.categorization_service.categorize_content(extracted_text)
-            if custom_category is not None:
-                category = custom_category
-                tags = custom_tags if custom_tags is not None else []
-            else:
-                category = cat_result.get('category')
-                tags = custom_tags if custom_tags is not None else cat_result.get('tags', [])
-            summary = extracted_text.get("summary", "")
-            # Step 4: Create metadata
-            logger.debug("Creating content metadata")
-            # Implement metadata creation logic
-            raw_metadata = extracted_text.get("metadata", {})
-            metadata = ContentMetadata(
-                title=title,
-                author=raw_metadata.get("author", "Unknown"),
-                abstract=raw_metadata.get("abstract", ""),
-                keywords=raw_metadata.get("keywords", []),
-                date_published=raw_metadata.get("date_published", datetime.now())
-            )
-            # Step 5: Create content record
+            category, summary, tags = self._categorize(extracted_text, custom_category, custom_tags)
+            # Step 4: Create content record with metadata
             logger.debug("Creating content record")
-            # Implement ContentRecord creation logic
-            record = extracted_text.get("content", "")
-            content_record = ContentRecord(
-                original_content=record,
+            content_record = self._build_content_record(
+                extracted_text,
                 content_type="text",
-                text = text,
                 title=title,
                 category=category,
                 summary=summary,
                 tags=tags,
-                embedding=embedding,
-                timestamp=datetime.now(),
-                source_url=None,
-                metadata=metadata
+                embedding=embedding
             )
-            # Step 6: Store in vector database
+            # Step 5: Store in vector database
             logger.debug("Storing text content in vector database")
             # Implement vector_database.store() method
             self.vector_database.store(content_record)
             
+            self._remember_stored_record(cache_key, content_record)
             logger.info("Successfully stored text content")
             # return the created content_record
             return content_record
@@ -293,7 +491,12 @@ class ContentManager:
         custom_tags: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
-        Store multiple URLs in bulk with parallel processing.
+        Store multiple URLs in bulk.
+        
+        URLs are processed in batches: the pages of a batch are fetched
+        concurrently, embedded in one call and stored with one write, while the
+        next batch is already downloading. Duplicate URLs are processed once. Only one or two batches of page content are held
+        in memory at a time.
         
         Args:
             urls: List of URLs to process
@@ -303,13 +506,10 @@ class ContentManager:
         Returns:
             Dict containing success/failure counts and results
         """
+        # A URL listed twice is fetched and stored once
+        urls = list(dict.fromkeys(urls))
         logger.info(f"Starting bulk storage for {len(urls)} URLs")
         
-        # Implement bulk storage logic
-        # - Initialize results dictionary with success/failed lists
-        # - Iterate through URLs and call store_content_from_url for each
-        # - Collect success and failure information
-        # - Return results summary with counts and details
         results = {
             'success_count': 0,
             'failed_count': 0,
@@ -317,22 +517,120 @@ class ContentManager:
             'success': [],
             'failed': []
         }
-        for url in urls:
+        
+        def record_success(url: str, record: ContentRecord) -> None:
+            results['success_count'] += 1
+            results['success'].append({'url': url, 'content_id': str(record.content_id)})
+        
+        def record_failure(url: str, error: Exception) -> None:
+            if not isinstance(error, ContentStorageException):
+                error = ContentStorageException(f"Content storage failed: {str(error)}")
+            logger.error(f"Failed to store content from URL {url}: {str(error)}")
+            results['failed_count'] += 1
+            results['failed'].append({'url': url, 'error': str(error)})
+        
+        def store_batch(fetches) -> None:
+            # Step 2: Collect the extracted pages of this batch
+            extracted_items = []
+            for url, future in fetches:
+                try:
+                    extracted_items.append((url, future.result()))
+                except Exception as e:
+                    record_failure(url, e)
+            if not extracted_items:
+                return
+            
+            # Step 3: Embed the whole batch in a single call
             try:
-                record = self.store_content_from_url(
-                    url,
-                    custom_category,
-                    custom_tags
+                embeddings = self.embedding_service.generate_embedding(
+                    [extracted['content'].strip() for _, extracted in extracted_items]
                 )
-                results['success_count']+= 1
-                results['success'].append({'url': url, 'content_id': str(record.content_id)})
-            except ContentStorageException as e:
-                results['failed_count']+= 1
-                results['failed'].append({'url': url, 'error': str(e)})
+            except Exception as e:
+                for url, _ in extracted_items:
+                    record_failure(url, e)
+                return
+            
+            # Step 4: Categorize and build each record
+            built = []
+            for (url, extracted), embedding in zip(extracted_items, embeddings):
+                try:
+                    built.append((url, self._create_url_record(
+                        url, extracted, _to_list(embedding), custom_category, custom_tags
+                    )))
+                except Exception as e:
+                    record_failure(url, e)
+            if not built:
+                return
+            
+            # Step 5: Store the whole batch with a single write
+            try:
+                self.vector_database.store_many(
+                    [record.model_dump() for _, record in built],
+                    [record.category for _, record in built]
+                )
+            except Exception as e:
+                for url, _ in built:
+                    record_failure(url, e)
+                return
+            for url, record in built:
+                self._remember_stored_record(_url_cache_key(url, custom_category, custom_tags), record)
+                record_success(url, record)
+        
+        # Step 1: Skip URLs that have been stored already
+        pending_urls = []
+        for url in urls:
+            cached_record = self._get_stored_record(_url_cache_key(url, custom_category, custom_tags))
+            if cached_record is not None:
+                record_success(url, cached_record)
+            else:
+                pending_urls.append(url)
+        
+        if pending_urls:
+            batches = _chunked(pending_urls, _BULK_BATCH_SIZE)
+            with ThreadPoolExecutor(max_workers=min(_MAX_EXTRACTION_WORKERS, len(pending_urls))) as executor:
+                def submit(batch: List[str]):
+                    return [(url, executor.submit(self._extract_url_content, url)) for url in batch]
+                
+                # Fetching is I/O bound, so the next batch downloads while the
+                # current one is embedded and stored
+                in_flight = submit(next(batches, []))
+                while in_flight:
+                    current, in_flight = in_flight, submit(next(batches, []))
+                    store_batch(current)
 
         logger.info(f"Bulk storage complete: {results['success_count']} succeeded, {results['failed_count']} failed")
         return results
     
+    @staticmethod
+    def _records_from_result(result: Dict[str, Any], category: Optional[str] = None) -> List[ContentRecord]:
+        """Build ContentRecords from a vector database get result, rows in result order."""
+        content_records = []
+        for i in range(len(result['ids'])):
+            
+            content_metadata = ContentMetadata(
+                title=result['metadatas'][i]['title'],
+                author=result['metadatas'][i].get('author', 'Unknown'),
+                abstract=result['metadatas'][i].get('abstract', ''),
+                keywords=result['metadatas'][i].get('keywords', []),
+                date_published=datetime.fromtimestamp(result['metadatas'][i].get('date_published', datetime.now().timestamp()))
+            )
+
+            content_record = ContentRecord(
+                content_id=result['ids'][i],
+                original_content=result['documents'][i],
+                content_type=result['metadatas'][i].get('content_type', 'unknown'),
+                title=result['metadatas'][i]['title'],
+                summary=result['metadatas'][i].get('summary', ''),
+                category=category or result['metadatas'][i].get('category', ''),
+                tags=_split_tags(result['metadatas'][i].get('tags', [])),
+                embedding=_to_list(result['embeddings'][i]),
+                timestamp=datetime.fromtimestamp(result['metadatas'][i].get('timestamp', datetime.now().timestamp())),
+                source_url=result['metadatas'][i].get('url', None),
+                metadata=content_metadata
+            )
+            content_records.append(content_record)
+        return content_records
+    
     def retrieve_content_by_category(
         self,
         category: str,
@@ -357,32 +655,7 @@ class ContentManager:
             # Implement vector_database.get_by_category() method
             result = self.vector_database.get_by_category(category, limit)
 
-            content_records = []
-            for i in range(len(result['ids'])):
-                
-                content_metadata = ContentMetadata(
-                    title=result['metadatas'][i]['title'],
-                    author=result['metadatas'][i].get('author', 'Unknown'),
-                    abstract=result['metadatas'][i].get('abstract', ''),
-                    keywords=result['metadatas'][i].get('keywords', []),
-                    date_published=datetime.fromtimestamp(result['metadatas'][i].get('date_published', datetime.now().timestamp()))
-                )
-
-                content_record = ContentRecord(
-                    content_id=result['ids'][i],
-                    original_content=result['documents'][i],
-                    content_type=result['metadatas'][i].get('content_type', 'unknown'),
-                    title=result['metadatas'][i]['title'],
-                    summary=result['metadatas'][i].get('summary', ''),
-                    category=category,
-                    tags=result['metadatas'][i].get('tags', []),
-                    embedding=result['embeddings'][i],
-                    timestamp=datetime.fromtimestamp(result['metadatas'][i].get('timestamp', datetime.now().timestamp())),
-                    source_url=result['metadatas'][i].get('url', None),
-                    metadata=content_metadata
-                )
-                content_records.append(content_record)
-            return content_records
+            return self._records_from_result(result, category)
             # raise NotImplementedError("Vector database get_by_category not yet implemented")
         except Exception as e:
             logger.error(f"Failed to retrieve content by category: {str(e)}")
@@ -411,13 +684,59 @@ class ContentManager:
         logger.info(f"Retrieving content from {start_date} to {end_date}")
         
         try:
-            # Implement vector_database.query_by_date_range() method
-          return self.vector_database.query_by_date_range(start_date, end_date, category)
-           # raise NotImplementedError("Vector database query_by_date_range not yet implemented")
+            result = self.vector_database.query_by_date_range(start_date, end_date, category=category)
+            return self._records_from_result(result)
         except Exception as e:
             logger.error(f"Failed to retrieve content by date range: {str(e)}")
             raise ContentRetrievalException(f"Content retrieval failed: {str(e)}")
     
+    async def retrieve_content_by_category_async(
+        self,
+        category: str,
+        limit: Optional[int] = None
+    ) -> List[ContentRecord]:
+        """
+        Async variant of retrieve_content_by_category.
+        
+        The blocking Chroma call runs in a worker thread so the event loop can
+        keep serving other requests while it waits.
+        
+        Args:
+            category: Category to filter by
+            limit: Maximum number of records to return
+            
+        Returns:
+            List of ContentRecord objects
+            
+        Raises:
+            ContentRetrievalException: If retrieval fails
+        """
+        return await asyncio.to_thread(self.retrieve_content_by_category, category, limit)
+    
+    async def retrieve_content_by_date_range_async(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        category: Optional[str] = None
+    ) -> List[ContentRecord]:
+        """
+        Async variant of retrieve_content_by_date_range.
+        
+        Args:
+            start_date: Start of date range
+            end_date: End of date range
+            category: Optional category filter
+            
+        Returns:
+            List of ContentRecord objects
+            
+        Raises:
+            ContentRetrievalException: If retrieval fails
+        """
+        return await asyncio.to_thread(
+            self.retrieve_content_by_date_range, start_date, end_date, category
+        )
+    
     def similarity_search(
         self,
         query_text: str,
@@ -507,26 +826,18 @@ class ContentManager:
             if not content_summaries:
                 raise QuizGenerationException("No content found")
             # Step 3: Generate quiz based on quiz_type
-            logger.debug(f"Generating {quiz_type} quiz")
+            logger.debug("Generating %s quiz", quiz_type)
             # Implement quiz generation logic
             # - Handle mcq, fill_in_blank, and true_false quiz types
             # - Call appropriate quiz_service method
             # - Validate quiz_type and raise exception for unsupported types
-            if quiz_type == "mcq":
-                quiz = self.quiz_service.generate_mcq_quiz(
-                    content_summaries, category, num_questions, difficulty
-                )
-            elif quiz_type == "fill_in_blank":
-                quiz = self.quiz_service.generate_fill_in_blank_quiz(
-                    content_summaries, category, num_questions, difficulty
-                )
-            elif quiz_type == "true_false":
-                quiz = self.quiz_service.generate_true_false_quiz(
-                    content_summaries, category, num_questions, difficulty
-                )
-            else:
+            generator_name = _QUIZ_GENERATORS.get(quiz_type)
+            if generator_name is None:
                 raise QuizGenerationException(f"Unsupported quiz type: {quiz_type}")
-            logger.info(f"Successfully generated quiz")
+            quiz = getattr(self.quiz_service, generator_name)(
+                content_summaries, category, num_questions, difficulty
+            )
+            logger.info("Successfully generated quiz with %d questions", len(quiz.questions))
             # return the generated quiz
             return quiz
             
@@ -1,9 +1,17 @@
+import contextlib
+import gc
+import hashlib
+from collections import OrderedDict
 from enum import Enum
 from sentence_transformers import SentenceTransformer, util
 import torch
 import numpy as np
 from typing import List, Tuple, Union, Dict
 
+# Number of per-text embeddings remembered by each EmbeddingService
+_EMBEDDING_CACHE_SIZE = 1024
+
+
 class EmbeddingModels(Enum): 
     MINI_LM_L6_V2 = "all-MiniLM-L6-v2"
     PARAPHRASE_MPNET_BASE_V2 = "paraphrase-mpnet-base-v2"
@@ -12,8 +20,24 @@ class EmbeddingModels(Enum):
     ALL_MPNET_BASE_V2 = "all-mpnet-base-v2"
 
 class EmbeddingService:
-    def __init__(self, model_name=EmbeddingModels.MINI_LM_L6_V2):
+    def __init__(self, model_name=EmbeddingModels.MINI_LM_L6_V2, compile_model: bool = False):
         self.model = self._initialize_model(model_name)
+        self._embedding_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        # On GPUs, let float32 matmuls use TF32 and run encoding in bfloat16
+        # where supported; CPU inference is left in full precision
+        self._autocast_dtype = None
+        if torch.cuda.is_available():
+            torch.set_float32_matmul_precision("high")
+            if torch.cuda.is_bf16_supported():
+                self._autocast_dtype = torch.bfloat16
+            if compile_model:
+                # Opt-in: CUDA graphs cut the launch overhead that dominates small batches,
+                # but inputs are not padded, so every new batch size or sequence length
+                # recompiles and captures another graph. Only enable it for workloads
+                # with fixed input shapes. Warm up here so the first request does not
+                # pay for compilation
+                self.model.compile(mode="reduce-overhead")
+                self._encode(["warmup"])
 
     def _initialize_model(self, model_name: EmbeddingModels) -> SentenceTransformer:
         """
@@ -33,12 +57,27 @@ class EmbeddingService:
         
         return SentenceTransformer(model_name.value)
 
-    def generate_embedding(self, text: Union[str, List[str]]) -> np.ndarray:
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Run the model on a list of texts and return float32 embeddings."""
+        autocast = (
+            torch.autocast("cuda", dtype=self._autocast_dtype)
+            if self._autocast_dtype is not None
+            else contextlib.nullcontext()
+        )
+        with autocast, torch.inference_mode():
+            embeddings = self.model.encode(texts)
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def generate_embedding(self, text: Union[str, List[str]], use_cache: bool = True) -> np.ndarray:
         """
         Generate embeddings for input text(s).
         
+        Embeddings of recently seen texts are reused, so only texts that are
+        not cached are passed to the model.
+        
         Args:
             text: A single string or a list of strings to encode
+            use_cache: Whether to reuse and remember embeddings of identical texts
             
         Returns:
             np.ndarray: Embedding vector(s) for the input text(s).
@@ -54,14 +93,38 @@ class EmbeddingService:
         """
         if isinstance(text, str):
             text = [text]
-        return self.model.encode(text)
+        if not use_cache or not isinstance(text, (list, tuple)) or not text:
+            return self._encode(text)
+        
+        keys = [hashlib.blake2b(t.encode("utf-8"), digest_size=16).digest() for t in text]
+        missing = {}
+        for key, t in zip(keys, text):
+            if key not in self._embedding_cache and key not in missing:
+                missing[key] = t
+        
+        if missing:
+            encoded = self._encode(list(missing.values()))
+            for key, row in zip(missing, encoded):
+                self._embedding_cache[key] = np.array(row, copy=True)
+        
+        rows = []
+        for key in keys:
+            self._embedding_cache.move_to_end(key)
+            rows.append(self._embedding_cache[key])
+        while len(self._embedding_cache) > _EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+        return np.stack(rows)
 
     def clear_model(self):
-        """Free model from memory"""
+        """Free model from memory, including memory held by the CUDA allocator"""
         if self.model:
             del self.model
             self.model = None
-            torch.cuda.empty_cache() if torch.cuda.is_available() else None
+            self._embedding_cache.clear()
+            gc.collect()
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+                torch.cuda.ipc_collect()
 
     def cosine_similarity(
         self, 
@@ -78,12 +141,28 @@ class EmbeddingService:
         Returns:
             float: Cosine similarity score between -1 and 1
             
+        Raises:
+            ValueError: If list or array inputs are not 1-D vectors of equal length
+            
         Example:
             >>> service = EmbeddingService()
             >>> emb1 = service.generate_embedding(["Hello world"])
             >>> emb2 = service.generate_embedding(["Hi there"])
             >>> similarity = service.cosine_similarity(emb1[0], emb2[0])
         """
+        # Plain vectors are compared directly in NumPy; the torch round-trip
+        # costs more than the arithmetic for a single pair
+        if not isinstance(embedding1, torch.Tensor) and not isinstance(embedding2, torch.Tensor):
+            vector1 = np.asarray(embedding1, dtype=np.float32)
+            vector2 = np.asarray(embedding2, dtype=np.float32)
+            if vector1.ndim != 1 or vector1.shape != vector2.shape:
+                raise ValueError(
+                    f"Embeddings must be 1-D vectors of equal length, got shapes {vector1.shape} and {vector2.shape}."
+                )
+            norm1 = max(float(np.linalg.norm(vector1)), 1e-12)
+            norm2 = max(float(np.linalg.norm(vector2)), 1e-12)
+            return float(np.dot(vector1, vector2)) / (norm1 * norm2)
+        
         # Convert to tensors if needed
         if isinstance(embedding1, list):
             embedding1 = torch.tensor(embedding1)
@@ -260,10 +339,20 @@ class EmbeddingService:
         elif isinstance(query_embeddings, np.ndarray):
             query_embeddings = torch.from_numpy(query_embeddings)
         
+        if len(query_embeddings) == 0:
+            return []
+        
+        # Score every query against the corpus in one matrix product
+        similarities = util.cos_sim(query_embeddings, corpus_embeddings)
+        top_results = torch.topk(similarities, k=min(top_k, similarities.shape[1]), dim=1)
+        
         results = []
-        for query_emb in query_embeddings:
-            result = self.find_most_similar(query_emb, corpus_embeddings, top_k, threshold)
-            results.append(result)
+        for scores, indices in zip(top_results.values.tolist(), top_results.indices.tolist()):
+            results.append([
+                (idx, score)
+                for idx, score in zip(indices, scores)
+                if threshold is None or score >= threshold
+            ])
             
         return results
 
@@ -297,20 +386,19 @@ class EmbeddingService:
         # Compute similarity matrix
         sim_matrix = util.cos_sim(embeddings, embeddings)
         
-        duplicates = []
-        n = len(embeddings)
-        
-        # Check upper triangle of matrix (avoid checking same pair twice)
-        for i in range(n):
-            for j in range(i + 1, n):
-                similarity = sim_matrix[i][j].item()
-                if similarity >= threshold:
-                    duplicates.append((i, j, similarity))
+        # Keep the upper triangle only (avoid checking same pair twice)
+        mask = torch.triu(sim_matrix >= threshold, diagonal=1)
+        pairs = mask.nonzero()
+        scores = sim_matrix[pairs[:, 0], pairs[:, 1]]
         
         # Sort by similarity (highest first)
-        duplicates.sort(key=lambda x: x[2], reverse=True)
+        order = torch.argsort(scores, descending=True, stable=True)
         
-        return duplicates
+        return list(zip(
+            pairs[order, 0].tolist(),
+            pairs[order, 1].tolist(),
+            scores[order].tolist()
+        ))
 
     def cluster_embeddings(
         self,
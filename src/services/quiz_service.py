@@ -1,3 +1,4 @@
+from functools import lru_cache
 from openai import OpenAI
 import instructor
 from typing import List
@@ -7,9 +8,14 @@ from src.models.quiz import Quiz, QuizQuestion, QuizResult
 
 #api_key = os.getenv("OPENAI_API_KEY")
 
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> instructor.Instructor:
+    """Return a shared client per API key so its HTTP connection pool is reused."""
+    return instructor.from_openai(OpenAI(api_key=api_key))
+
 class QuizService:
     def __init__(self, api_key: str):
-        self.client = instructor.from_openai(OpenAI(api_key=api_key))
+        self.client = _get_client(api_key)
     
     def generate_mcq_quiz(self, content_summaries: List[str], 
                     category: str, num_questions: int = 5, difficulty: str = "mixed") -> Quiz:
@@ -1,24 +1,92 @@
+import heapq
+import os
+import threading
 import chromadb
 from chromadb.api.types import GetResult, QueryResult
 from uuid import uuid4
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple, Iterator
 
 class VectorDatabaseError(Exception):
     """Base exception for vector database operations."""
     pass
 
+# Smallest step between timestamps issued to one database, in seconds
+_TIMESTAMP_STEP = 1e-6
+
 class VectorDatabase:
-    def __init__(self, persist_directory="./data/chroma_db"):
+    _COLLECTION_NAME = "content_embeddings"
+
+    def __init__(self, persist_directory="./data/chroma_db", in_memory=False):
         try:
-            self.client = chromadb.PersistentClient(path=persist_directory)
-            self.collection = self.client.get_or_create_collection(
-                name="content_embeddings",
-                metadata={"hnsw:space": "cosine"}
-            )
+            # in_memory skips the on-disk store entirely; persist_directory is then ignored.
+            # Ephemeral clients share one in-process system, so each in-memory instance
+            # gets its own collection to stay isolated from the others.
+            self._in_memory = in_memory
+            if in_memory:
+                self.client = chromadb.EphemeralClient()
+                self._collection_name = f"{self._COLLECTION_NAME}-{uuid4().hex}"
+            else:
+                self.client = chromadb.PersistentClient(path=persist_directory)
+                self._collection_name = self._COLLECTION_NAME
+            self.collection = self._open_collection()
+            # (collection count, facets) from the last full metadata scan
+            self._facet_cache: Optional[Tuple[int, Dict[str, List[str]]]] = None
+            self._clock_lock = threading.Lock()
+            self._last_timestamp = 0.0
+            self._generation = 0
         except Exception as e:
             raise VectorDatabaseError(f"Failed to initialize database: {str(e)}")
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever stored content is removed, so callers can drop stale caches."""
+        return self._generation
     
+    def _open_collection(self):
+        """Get or create the content collection on the current client."""
+        return self.client.get_or_create_collection(
+            name=self._collection_name,
+            metadata={"hnsw:space": "cosine"}
+        )
+
+    def reset(self) -> None:
+        """
+        Remove all stored content by dropping and recreating the collection.
+        Raises:
+            VectorDatabaseError: If the collection cannot be recreated.
+        """
+        try:
+            self.client.delete_collection(self._collection_name)
+            self.collection = self._open_collection()
+            self._facet_cache = None
+            self._generation += 1
+        except Exception as e:
+            raise VectorDatabaseError(f"Failed to reset database: {str(e)}")
+
+    def _next_timestamps(self, n: int) -> List[float]:
+        """
+        Issue ``n`` insertion timestamps that increase strictly, across calls as well
+        as within a batch, so items written by this instance never share a timestamp.
+        """
+        with self._clock_lock:
+            base = max(datetime.now().timestamp(), self._last_timestamp + _TIMESTAMP_STEP)
+            timestamps = [base + i * _TIMESTAMP_STEP for i in range(n)]
+            self._last_timestamp = timestamps[-1]
+        return timestamps
+
+    @staticmethod
+    def _build_metadata(content_dict: Dict[str, Any], category: str, timestamp: float) -> Dict[str, Any]:
+        """Build the Chroma metadata record for a content item."""
+        return {
+            "title": content_dict.get('title', ''),
+            "category": category,
+            "timestamp": timestamp,
+            "url": content_dict.get('source_url', ''),
+            "tags": ','.join(content_dict.get('tags', [])),
+            "summary": content_dict.get('summary', '')
+        }
+
     def store(self, content_dict: Dict[str, Any], category: str) -> str:
         """  
         Store a content item in the vector database with associated metadata.  
@@ -34,23 +102,54 @@ class VectorDatabase:
             underlying collection add method raises an exception).
         """  
         try:
-            doc_id = str(uuid4())
+            doc_id = uuid4().hex
             self.collection.add(
                 # embeddings=[embedding],
                 documents=[content_dict.get('content', content_dict.get('original_content', ''))],
-                metadatas=[{
-                    "title": content_dict.get('title', ''),
-                    "category": category,
-                    "timestamp": datetime.now().timestamp(),
-                    "url": content_dict.get('source_url', ''),
-                    "tags": ','.join(content_dict.get('tags', [])),
-                    "summary": content_dict.get('summary', '')
-                }],
+                metadatas=[self._build_metadata(content_dict, category, self._next_timestamps(1)[0])],
                 ids=[doc_id]
             )
+            self._facet_cache = None
             return doc_id
         except Exception as e:
             raise VectorDatabaseError(f"Failed to store content: {str(e)}")
+
+    def store_many(self, content_dicts: List[Dict[str, Any]], categories: List[str]) -> List[str]:
+        """
+        Store several content items with a single collection write.
+        Args:
+            content_dicts (List[Dict[str, Any]]): Content dictionaries, with the same keys as ``store``.
+            categories (List[str]): The category for each content item, in the same order.
+        Returns:
+            List[str]: The identifiers assigned to the stored items, in input order.
+        Raises:
+            VectorDatabaseError: If the inputs are mismatched or the storage operation fails.
+        """
+        if len(content_dicts) != len(categories):
+            raise VectorDatabaseError("Failed to store content: content_dicts and categories differ in length")
+        if not content_dicts:
+            return []
+        try:
+            n = len(content_dicts)
+            # One urandom call for the whole batch; same 128 random bits per id as uuid4.
+            # Ids are opaque: paging orders by (timestamp, id) string, so they need not
+            # sort in any particular way, and older dashed uuid4 ids mix in safely.
+            raw = os.urandom(16 * n)
+            doc_ids = [raw[i * 16:(i + 1) * 16].hex() for i in range(n)]
+            # One timestamp per item, increasing in input order
+            timestamps = self._next_timestamps(n)
+            self.collection.add(
+                documents=[c.get('content', c.get('original_content', '')) for c in content_dicts],
+                metadatas=[
+                    self._build_metadata(c, category, timestamp)
+                    for c, category, timestamp in zip(content_dicts, categories, timestamps)
+                ],
+                ids=doc_ids
+            )
+            self._facet_cache = None
+            return doc_ids
+        except Exception as e:
+            raise VectorDatabaseError(f"Failed to store content: {str(e)}")
     
     def similarity_search(self,
                          query_texts: Optional[List[str]] = None,
@@ -83,36 +182,113 @@ class VectorDatabase:
                             start_date: datetime, 
                             end_date: datetime, 
                             k: int = 10,
-                            offset: int = 0) -> Dict[str, Any]:
+                            cursor: Optional[Tuple[float, str]] = None,
+                            category: Optional[str] = None) -> Dict[str, Any]:
         """
         Query documents within a specific date range.
+        Pages are addressed with a keyset cursor instead of an offset, so fetching
+        a deep page costs the same as fetching the first one.
         Args:
             start_date (datetime): The start date for the query range.
             end_date (datetime): The end date for the query range.
             k (int, optional): Maximum number of results to return. Defaults to 10.
-            offset (int, optional): Number of results to skip for pagination. Defaults to 0.
+            cursor (Optional[Tuple[float, str]], optional): ``(timestamp, id)`` of the last
+                item of the previous page, i.e. ``(results['metadatas'][-1]['timestamp'],
+                results['ids'][-1])``. Defaults to None for the first page.
+            category (Optional[str], optional): Only return items in this category.
+                Defaults to None.
         Returns:
             Dict[str, Any]: A dictionary of results as returned by the underlying collection.
         Raises:
             VectorDatabaseError: If the date range query fails.
         """
         try:
-            results = self.collection.get(
-                # query_texts=[""],
-                limit=k,
-                offset=offset,
-                where={
-                    "$and": [
-                        {"timestamp": {"$gte": start_date.timestamp()}},
-                        {"timestamp": {"$lte": end_date.timestamp()}}
-                    ]
-                },
+            conditions = [
+                {"timestamp": {"$gte": start_date.timestamp()}},
+                {"timestamp": {"$lte": end_date.timestamp()}}
+            ]
+            if category is not None:
+                conditions.append({"category": category})
+            return self._get_page(
+                conditions,
+                k,
+                cursor,
                 include=["metadatas", "documents", "embeddings"]
             )
-            return results
         except Exception as e:
             raise VectorDatabaseError(f"Failed to query by date range: {str(e)}")
-    
+
+    def _get_page(self,
+                  conditions: List[Dict[str, Any]],
+                  k: int,
+                  cursor: Optional[Tuple[float, str]],
+                  include: List[str]) -> Dict[str, Any]:
+        """
+        Fetch up to ``k`` items matching ``conditions`` that come after ``cursor``.
+        Items are ordered by ``(timestamp, id)``. Chroma returns rows in storage order,
+        so the candidates after the cursor are fetched as ids and metadata only, ordered
+        here, and just the ``k`` selected rows are fetched with the requested fields.
+        Args:
+            conditions (List[Dict[str, Any]]): Metadata filters combined with ``$and``.
+            k (int): Maximum number of results to return.
+            cursor (Optional[Tuple[float, str]]): ``(timestamp, id)`` of the last item
+                already returned, or None for the first page.
+            include (List[str]): Fields to include in the result.
+        Returns:
+            Dict[str, Any]: A dictionary of results as returned by the underlying collection,
+            with rows in ``(timestamp, id)`` order.
+        """
+        if cursor is not None:
+            last_key = (float(cursor[0]), str(cursor[1]))
+            conditions = conditions + [{"timestamp": {"$gte": last_key[0]}}]
+
+        if not conditions:
+            where = None
+        elif len(conditions) == 1:
+            where = conditions[0]
+        else:
+            where = {"$and": conditions}
+
+        candidates = self.collection.get(where=where, include=["metadatas"])
+        keys = (
+            (meta.get("timestamp", 0.0), doc_id)
+            for doc_id, meta in zip(candidates["ids"], candidates["metadatas"])
+        )
+        if cursor is not None:
+            keys = (key for key in keys if key > last_key)
+        page_ids = [doc_id for _, doc_id in heapq.nsmallest(k, keys)]
+        if not page_ids:
+            return {"ids": [], **{field: [] for field in include}, "included": include}
+
+        results = self.collection.get(ids=page_ids, include=include)
+        position = {doc_id: i for i, doc_id in enumerate(results["ids"])}
+        order = [position[doc_id] for doc_id in page_ids]
+        page = dict(results)
+        for key in ("ids", *include):
+            rows = results.get(key)
+            if rows is not None:
+                page[key] = [rows[i] for i in order]
+        return page
+
+    def _iter_metadatas(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the metadata of every stored item, one batch in memory at a time.
+        Args:
+            batch_size (int, optional): Number of records to fetch per batch.
+                Defaults to 1000.
+        Yields:
+            Dict[str, Any]: The metadata dictionary of each item.
+        """
+        # A full scan needs no ordering, so plain offset paging is enough
+        offset = 0
+        while True:
+            batch = self.collection.get(limit=batch_size, offset=offset, include=["metadatas"])
+            metadatas = batch.get("metadatas") or []
+            yield from metadatas
+            if len(metadatas) < batch_size:
+                break
+            offset += batch_size
+
     def get_by_category(self, category: str, limit: int = 10) -> Dict[str, Any]:
         """
         Retrieve documents by category.
@@ -133,6 +309,35 @@ class VectorDatabase:
         except Exception as e:
             raise VectorDatabaseError(f"Failed to get by category: {str(e)}")
     
+    def _get_facets(self, batch_size: int = 1000) -> Dict[str, List[str]]:
+        """
+        Collect unique categories and tags in a single pass over the collection.
+        The result is cached and reused for as long as the collection count is
+        unchanged, so repeated facet queries do not rescan every record.
+        Args:
+            batch_size (int, optional): Number of records to fetch per batch.
+                Defaults to 1000.
+        Returns:
+            Dict[str, List[str]]: Sorted ``'categories'`` and ``'tags'`` lists.
+        """
+        count = self.collection.count()
+        if self._facet_cache is not None and self._facet_cache[0] == count:
+            return self._facet_cache[1]
+
+        categories: set[str] = set()
+        tags: set[str] = set()
+        for meta in self._iter_metadatas(batch_size):
+            category = meta.get("category", "")
+            if category:
+                categories.add(category)
+            tag_str = meta.get("tags", "")
+            if tag_str:
+                tags.update(t.strip() for t in tag_str.split(',') if t.strip())
+
+        facets = {"categories": sorted(categories), "tags": sorted(tags)}
+        self._facet_cache = (count, facets)
+        return facets
+
     def get_all_categories(self, batch_size: int = 1000) -> List[str]:
         """
         List all unique categories.
@@ -145,31 +350,7 @@ class VectorDatabase:
             VectorDatabaseError: If fetching categories fails.
         """
         try:
-            categories: set[str] = set()
-            offset = 0
-
-            while True:
-                batch = self.collection.get(
-                    limit=batch_size,
-                    offset=offset,
-                    include=["metadatas"]
-                )
-
-                if not batch or not batch.get("metadatas"):
-                    break
-
-                for meta in batch["metadatas"]:
-                    category = meta.get("category", "")
-                    if category:
-                        categories.add(category)
-
-                ids = batch.get("ids") or []
-                if len(ids) < batch_size:
-                    break
-
-                offset += batch_size
-
-            return sorted(categories)
+            return list(self._get_facets(batch_size)["categories"])
         except Exception as e:
             raise VectorDatabaseError(f"Failed to get categories: {str(e)}")
     
@@ -185,31 +366,7 @@ class VectorDatabase:
             VectorDatabaseError: If fetching tags fails.
         """
         try:
-            tags: set[str] = set()
-            offset = 0
-
-            while True:
-                batch = self.collection.get(
-                    limit=batch_size,
-                    offset=offset,
-                    include=["metadatas"]
-                )
-
-                if not batch or not batch.get("metadatas"):
-                    break
-
-                for meta in batch["metadatas"]:
-                    tag_str = meta.get("tags", "")
-                    if tag_str:
-                        tags.update(t.strip() for t in tag_str.split(',') if t.strip())
-
-                ids = batch.get("ids") or []
-                if len(ids) < batch_size:
-                    break
-
-                offset += batch_size
-
-            return sorted(tags)
+            return list(self._get_facets(batch_size)["tags"])
         except Exception as e:
             raise VectorDatabaseError(f"Failed to get tags: {str(e)}")
     
@@ -217,6 +374,10 @@ class VectorDatabase:
         """Close the underlying database client, if supported."""
         try:
             client = getattr(self, "client", None)
+            if client is not None and getattr(self, "_in_memory", False) and self.collection is not None:
+                # In-memory collections would otherwise outlive this instance in the shared system
+                client.delete_collection(self._collection_name)
+                self.collection = None
             if client is not None and hasattr(client, "close") and callable(getattr(client, "close", None)):
                 client.close()
                 # Optionally clear references after successful close
@@ -1,2 +1,4 @@
 def validate_url(url: str) -> bool:
-    return url.startswith("http://") or url.startswith("https://")
+    if not isinstance(url, str):
+        return False
+    return url.startswith(("http://", "https://"))
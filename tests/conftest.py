@@ -6,6 +6,8 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 # tests/conftest.py
+# The sample model fixtures are built once per session; tests only read them.
+# Use model_copy() on a fixture if a test ever needs to modify one.
 import pytest
 from datetime import datetime
 from uuid import uuid4
@@ -13,18 +15,26 @@ from src.models.content import ContentRecord, ContentMetadata
 from src.models.quiz import Quiz, QuizQuestion, QuizResult  
 from src.models.responses import ToolResponse, ErrorResponse, SuccessResponse  
 
-@pytest.fixture
-def sample_metadata():
-    return ContentMetadata(
-        title="Sample Title",
-        author="John Doe",
-        abstract="A brief summary of the article.",
-        keywords=["keyword1", "keyword2"],
-        date_published=datetime.now(),
-    )
+@pytest.fixture(scope="session")
+def frozen_now():
+    return datetime(2024, 1, 1, 0, 0, 0)
 
-@pytest.fixture
-def sample_content_record(sample_metadata):
+@pytest.fixture(scope="session")
+def sample_metadata_dict(frozen_now):
+    return {
+        "title": "Sample Title",
+        "author": "John Doe",
+        "abstract": "A brief summary of the article.",
+        "keywords": ["keyword1", "keyword2"],
+        "date_published": frozen_now,
+    }
+
+@pytest.fixture(scope="session")
+def sample_metadata(sample_metadata_dict):
+    return ContentMetadata(**sample_metadata_dict)
+
+@pytest.fixture(scope="session")
+def sample_content_record(sample_metadata, frozen_now):
     return ContentRecord(
         original_content="This is a test content.",
         content_type="text",
@@ -33,10 +43,13 @@ def sample_content_record(sample_metadata):
         category="Education",
         tags=["testing", "sample"],
         embedding=[0.1, 0.2, 0.3],
-        timestamp=datetime.now(),
+        timestamp=frozen_now,
         metadata=sample_metadata
     )
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_content_record_dump(sample_content_record):
+    return sample_content_record.model_dump()
+@pytest.fixture(scope="session")
 def sample_quiz_question():
     return QuizQuestion(
         number=1,
@@ -45,7 +58,7 @@ def sample_quiz_question():
         explanation="A test is a procedure to determine the quality of something.",
         choice=["A procedure", "A result", "An error"]
     )
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_quiz(sample_quiz_question):
     return Quiz(
         title="Python Basics Quiz",
@@ -53,6 +66,11 @@ def sample_quiz(sample_quiz_question):
         questions=[sample_quiz_question]  
     )
 @pytest.fixture
+def make_quiz(sample_quiz):
+    # Variants of the validated sample quiz; model_copy skips re-validation,
+    # and deep=True keeps the session-scoped questions from being shared
+    return lambda **fields: sample_quiz.model_copy(update=fields, deep=True)
+@pytest.fixture(scope="session")
 def sample_quiz_result(sample_quiz):  
     return QuizResult(
         quiz_id=sample_quiz.quiz_id,
@@ -61,21 +79,21 @@ def sample_quiz_result(sample_quiz):
         score=85.0,
         total=10
     )
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tool_response():
     return ToolResponse(
         status="success",
         data={"key": "value"},
         message="Operation completed successfully."
     )
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_error_response():
     return ErrorResponse(
         status="error",
         error="An error occurred.",
         details={"code": 500, "info": "Internal Server Error"}
     )
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_success_response():
     return SuccessResponse(
         status="success",
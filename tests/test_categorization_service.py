@@ -1,7 +1,12 @@
+import asyncio
 import pytest
 from unittest.mock import Mock
 from openai import RateLimitError
-from src.services.categorization_service import CategorizationService, CategoryResults
+from src.services.categorization_service import (
+    CATEGORIZATION_INSTRUCTIONS,
+    CategorizationService,
+    CategoryResults,
+)
 
 
 @pytest.fixture
@@ -35,6 +40,24 @@ def test_categorize_content_success(mock_service):
     assert "automation" in result.summary.lower()
 
 
+def test_prompt_prefix_is_stable(monkeypatch):
+    service = CategorizationService(api_key="fake-key", cache_enabled=False)
+    sent = []
+
+    def mock_create(*args, **kwargs):
+        sent.append(kwargs["messages"])
+        return CategoryResults(category="Science", confidence=0.9, tags=["Physics"], summary="Summary")
+
+    service.client.chat.completions.create = mock_create
+
+    service.categorize_content("First", "Some content")
+    service.categorize_content("Second", "Other content")
+
+    assert sent[0][0] == sent[1][0] == {"role": "system", "content": CATEGORIZATION_INSTRUCTIONS}
+    assert "Some content" in sent[0][-1]["content"]
+    assert "Other content" in sent[1][-1]["content"]
+
+
 def test_retry_logic(monkeypatch):
     service = CategorizationService(api_key="fake-key")
     call_log = []
@@ -80,6 +103,34 @@ def test_retry_fails(monkeypatch):
         service.categorize_content("Title", "Valid content", retry_delay=0)
 
 
+def test_retry_logic_async(monkeypatch):
+    service = CategorizationService(api_key="fake-key")
+    call_log = []
+
+    def mock_create(*args, **kwargs):
+        call_log.append("called")
+        if len(call_log) < 3:
+            mock_response = Mock()
+            mock_response.status_code = 429
+            raise RateLimitError("Rate limit exceeded", response=mock_response, body=None)
+        return CategoryResults(
+            category="Science",
+            confidence=0.88,
+            tags=["Physics", "Quantum"],
+            summary="A summary about quantum physics."
+        )
+
+    service.client.chat.completions.create = mock_create
+
+    result = asyncio.run(service.categorize_content_async("Quantum", "Quantum mechanics topic", retry_delay=0))
+
+    assert len(call_log) == 3
+    assert result.category == "Science"
+    # The async path shares the cache with the sync one
+    assert service.categorize_content("Quantum", "Quantum mechanics topic") is result
+    assert len(call_log) == 3
+
+
 def test_caching(monkeypatch):
     service = CategorizationService(api_key="fake-key")
     call_counter = {"count": 0}
@@ -102,6 +153,13 @@ def test_caching(monkeypatch):
     assert r1 == r2
 
 
+def test_cache_key_separates_title_and_content():
+    service = CategorizationService(api_key="fake-key")
+
+    assert service._generate_cache_key("ab", "c") != service._generate_cache_key("a", "bc")
+    assert service._generate_cache_key("a", "bc") == service._generate_cache_key("a", "bc")
+
+
 def test_caching_disabled(monkeypatch):
     service = CategorizationService(api_key="fake-key", cache_enabled=False)
     call_counter = {"count": 0}
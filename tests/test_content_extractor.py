@@ -1,3 +1,7 @@
+import copy
+import socket
+import threading
+import time
 import pytest
 from bs4 import BeautifulSoup
 import requests
@@ -10,7 +14,7 @@ import requests_mock
 def extractor():
     return ContentExtractor()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_html():
     return """
     <html>
@@ -30,6 +34,10 @@ def mock_html():
     </html>
     """
 
+@pytest.fixture(scope="module")
+def parsed_html(mock_html):
+    return BeautifulSoup(mock_html, 'lxml')
+
 @pytest.fixture
 def sample_text():
     return "  This is some sample   text  with extra   spaces.  "
@@ -57,6 +65,25 @@ def test_extract_from_url_success(extractor, requests_mock, mock_html):
     assert result["metadata"]["author"] == "John Doe", "Author metadata not extracted correctly"
     assert result["metadata"]["date"] == "2024-01-01", "Date metadata not extracted correctly"
 
+def test_session_accepts_brotli(extractor):
+    headers = extractor._session.headers
+    assert "br" in headers["Accept-Encoding"], "Brotli should be advertised when brotli is installed"
+    assert headers["User-Agent"] == extractor.headers["User-Agent"]
+
+def test_extract_from_url_reuses_parse_for_identical_pages(extractor, requests_mock, mock_html, monkeypatch):
+    requests_mock.get("http://example.com/a", text=mock_html)
+    requests_mock.get("http://example.com/b", text=mock_html)
+    calls = []
+    original = extractor._extract_main_content
+    monkeypatch.setattr(extractor, "_extract_main_content", lambda soup: calls.append(soup) or original(soup))
+    
+    first = extractor.extract_from_url("http://example.com/a")
+    second = extractor.extract_from_url("http://example.com/b")
+    
+    assert len(calls) == 1, "Identical page bodies should only be parsed once"
+    assert second["content"] == first["content"]
+    assert second["url"] == "http://example.com/b"
+
 def test_extract_from_url_timeout(extractor, requests_mock):
     url = "http://example.com/timeout"
     requests_mock.get(url, exc=Timeout)
@@ -65,6 +92,37 @@ def test_extract_from_url_timeout(extractor, requests_mock):
     assert "error" in result, "Timeout error not reported in result"
     assert "timed out" in result["error"].lower(), "Incorrect error message for timeout"
 
+def test_extract_from_url_stalled_server_times_out_once(monkeypatch):
+    """Test that a server that never responds is reported as a timeout without retries"""
+    monkeypatch.setattr("src.services.content_extractor._REQUEST_TIMEOUT", 0.2)
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    accepted = []
+    
+    def accept_and_stall():
+        # Accept connections but never answer them
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+            accepted.append(conn)
+    
+    threading.Thread(target=accept_and_stall, daemon=True).start()
+    try:
+        start = time.monotonic()
+        result = ContentExtractor().extract_from_url(f"http://127.0.0.1:{server.getsockname()[1]}/")
+        elapsed = time.monotonic() - start
+    finally:
+        server.close()
+        for conn in accepted:
+            conn.close()
+    
+    assert result == {"error": "Request timed out"}, f"Expected a timeout error, got {result}"
+    assert len(accepted) == 1, f"Read timeouts should not be retried, got {len(accepted)} connections"
+    assert elapsed < 2, f"Expected a single timeout, took {elapsed:.2f}s"
+
 def test_extract_from_url_connection_error(extractor, requests_mock):
     url = "http://example.com/connection-error"
     requests_mock.get(url, exc=ConnectionError)
@@ -95,18 +153,32 @@ def test_extract_from_code(extractor, sample_code):
     assert "def test_function():" in result["content"], "Code content not preserved"
     assert result["metadata"]["type"] == "code", "Incorrect metadata type for code content"
 
-def test_extract_main_content(extractor, mock_html):
-    soup = BeautifulSoup(mock_html, 'html.parser')
-    content = extractor._extract_main_content(soup)
+def test_extract_main_content(extractor, parsed_html):
+    # _extract_main_content decomposes tags, so work on a copy of the shared tree
+    content = extractor._extract_main_content(copy.copy(parsed_html))
     
     assert "Main Heading" in content, "Main heading not found in extracted content"
     assert "This is the main content" in content, "Main content not found in extracted content"
     assert "alert('test')" not in content, "Script content was not removed"
     assert ".test { color: red; }" not in content, "Style content was not removed"
 
-def test_extract_metadata(extractor, mock_html):
-    soup = BeautifulSoup(mock_html, 'html.parser')
-    metadata = extractor._extract_metadata(soup)
+def test_extract_main_content_drops_page_chrome(extractor):
+    html = """
+    <html><body>
+        <nav>Home | About</nav>
+        <main>
+            <p>Body text.</p>
+            <aside>Related links</aside>
+        </main>
+        <footer>Copyright</footer>
+    </body></html>
+    """
+    content = extractor._extract_main_content(BeautifulSoup(html, 'lxml'))
+    
+    assert content == "Body text.", "Navigation, aside and footer text should be removed"
+
+def test_extract_metadata(extractor, parsed_html):
+    metadata = extractor._extract_metadata(parsed_html)
     
     assert metadata["author"] == "John Doe", "Author metadata not extracted correctly"
     assert metadata["date"] == "2024-01-01", "Date metadata not extracted correctly"
@@ -132,6 +204,17 @@ def test_extract_from_empty_url_content(extractor, requests_mock):
     assert result["content"] == "", "Empty page should return empty content"
     assert result["domain"] == "example.com", "Domain should still be extracted from empty page"
 
+def test_extract_from_url_truncates_large_body(extractor, requests_mock, monkeypatch):
+    """Test that oversized pages are cut off at the response size cap"""
+    monkeypatch.setattr("src.services.content_extractor._MAX_RESPONSE_BYTES", 200)
+    url = "http://example.com/large"
+    html = '<html><head><meta name="author" content="John Doe"></head><body><p>Start</p>' + "x" * 500 + "<p>TAIL</p></body></html>"
+    requests_mock.get(url, text=html)
+    
+    result = extractor.extract_from_url(url)
+    assert "Start" in result["content"], "Content before the cap should be kept"
+    assert "TAIL" not in result["content"], "Content past the cap should be dropped"
+
 def test_extract_metadata_missing_fields(extractor):
     """Test metadata extraction when fields are missing"""
     html = """
@@ -145,7 +228,7 @@ def test_extract_metadata_missing_fields(extractor):
         </body>
     </html>
     """
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml')
     
     with pytest.raises(MetadataExtractionException):
         metadata = extractor._extract_metadata(soup)
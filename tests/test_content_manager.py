@@ -4,9 +4,13 @@ Unit tests for ContentManager service.
 Tests the orchestration of multiple services and workflow management.
 """
 
+import asyncio
 import pytest
+from contextlib import ExitStack
+from dataclasses import dataclass
 from unittest.mock import Mock, MagicMock, patch, call
 from datetime import datetime
+from types import SimpleNamespace
 from uuid import uuid4
 
 from src.services.content_manager import (
@@ -16,11 +20,53 @@ from src.services.content_manager import (
     QuizGenerationException
 )
 from src.models.content import ContentRecord, ContentMetadata
-from src.models.quiz import Quiz, QuizQuestion
 from src.services.embedding_service import EmbeddingModels
 from src.services.categorization_service import CategoryResults
 
 
+@dataclass
+class FakeQuiz:
+    """Plain stand-in for a generated Quiz."""
+    questions: list
+
+
+@dataclass
+class FakeQuestion:
+    """Plain stand-in for a QuizQuestion."""
+
+
+SERVICE_CLASSES = [
+    "ContentExtractor",
+    "EmbeddingService",
+    "CategorizationService",
+    "VectorDatabase",
+    "QuizService",
+]
+
+
+@pytest.fixture(scope="class")
+def _service_patches():
+    """Patch every service class once per test class.
+    
+    Class scope ends the patches with the class that requested them, so tests
+    that build real services (TestContentManagerInitialization) never see them,
+    whatever order the tests run in.
+    """
+    with ExitStack() as stack:
+        yield {
+            name: stack.enter_context(patch(f"src.services.content_manager.{name}"))
+            for name in SERVICE_CLASSES
+        }
+
+
+@pytest.fixture
+def patched_services(_service_patches):
+    """Give each test fresh service mocks on top of the class-wide patches."""
+    for mock_class in _service_patches.values():
+        mock_class.reset_mock(return_value=True, side_effect=True)
+    return _service_patches
+
+
 class TestContentManagerInitialization:
     """Test ContentManager initialization."""
     
@@ -46,38 +92,62 @@ class TestContentManagerInitialization:
             assert manager.content_extractor is not None
             assert manager.embedding_service is not None
 
+    
+    def test_heavy_services_are_created_lazily(self):
+        """Test that embedding, database and quiz services are not built during init."""
+        manager = ContentManager(openai_api_key="test-key")
+        
+        assert manager._embedding_service is None
+        assert manager._vector_database is None
+        assert manager._quiz_service is None
+    
+    def test_lazy_service_is_reused(self):
+        """Test that a lazily created service is constructed only once."""
+        with patch('src.services.content_manager.EmbeddingService') as mock_embedding:
+            manager = ContentManager(
+                openai_api_key="test-key",
+                embedding_model=EmbeddingModels.ALL_MPNET_BASE_V2
+            )
+            
+            assert manager.embedding_service is manager.embedding_service
+            mock_embedding.assert_called_once_with(model_name=EmbeddingModels.ALL_MPNET_BASE_V2)
+    
+    def test_lazy_services_can_be_assigned(self):
+        """Test that assigning a service replaces it without building the default."""
+        with patch('src.services.content_manager.VectorDatabase') as mock_database:
+            manager = ContentManager(openai_api_key="test-key")
+            replacement = Mock()
+            
+            manager.vector_database = replacement
+            
+            assert manager.vector_database is replacement
+            mock_database.assert_not_called()
 
 class TestStoreContentFromURL:
     """Test URL content storage workflow."""
     
     @pytest.fixture
-    def manager(self):
+    def manager(self, patched_services):
         """Create ContentManager with mocked services."""
-        with patch('src.services.content_manager.ContentExtractor') as mock_extractor, \
-             patch('src.services.content_manager.EmbeddingService') as mock_embedding, \
-             patch('src.services.content_manager.CategorizationService') as mock_categorization, \
-             patch('src.services.content_manager.VectorDatabase') as mock_db, \
-             patch('src.services.content_manager.QuizService') as mock_quiz:
-            
-            manager = ContentManager(openai_api_key="test-key")
-            
-            # Setup mock responses
-            manager.content_extractor.extract_from_url.return_value = {
-                'title': 'Test Article',
-                'content': 'This is test content for the article.',
-                'url': 'https://example.com/article',
-                'domain': 'example.com',
-                'metadata': {'author': 'Test Author'}
-            }
-            
-            manager.embedding_service.generate_embedding.return_value = [0.1, 0.2, 0.3]
-            
-            manager.categorization_service.categorize_content.return_value = {
-                'category': 'Technology',
-                'summary': 'This is a technology article'
-            }
-            
-            yield manager
+        manager = ContentManager(openai_api_key="test-key")
+        
+        # Setup mock responses
+        manager.content_extractor.extract_from_url.return_value = {
+            'title': 'Test Article',
+            'content': 'This is test content for the article.',
+            'url': 'https://example.com/article',
+            'domain': 'example.com',
+            'metadata': {'author': 'Test Author'}
+        }
+        
+        manager.embedding_service.generate_embedding.return_value = [0.1, 0.2, 0.3]
+        
+        manager.categorization_service.categorize_content.return_value = {
+            'category': 'Technology',
+            'summary': 'This is a technology article'
+        }
+        
+        return manager
     
     def test_store_content_from_url_success(self, manager):
         """Test successful URL content storage."""
@@ -105,8 +175,9 @@ class TestStoreContentFromURL:
         result = manager.store_content_from_url(url, custom_category=custom_category)
         
         # Categorization service should not be called
-        # manager.categorization_service.categorize_content.assert_not_called()
+        manager.categorization_service.categorize_content.assert_not_called()
         assert result.category == custom_category
+        assert result.summary == "This is test content for the article."
     
     def test_store_content_with_custom_tags(self, manager):
         """Test storing content with custom tags."""
@@ -117,6 +188,33 @@ class TestStoreContentFromURL:
         
         assert result.tags == custom_tags
     
+    def test_store_content_repeated_url_uses_cache(self, manager):
+        """Test that storing the same URL twice reuses the first record."""
+        url = "https://example.com/article"
+        
+        first = manager.store_content_from_url(url)
+        second = manager.store_content_from_url(url)
+        
+        assert second == first
+        assert second is not first
+        manager.content_extractor.extract_from_url.assert_called_once_with(url)
+        manager.vector_database.store.assert_called_once()
+        
+        manager.store_content_from_url(url, custom_tags=["other"])
+        assert manager.content_extractor.extract_from_url.call_count == 2
+    
+    def test_store_content_cache_cleared_on_database_reset(self, manager):
+        """Test that a reset of the vector database invalidates remembered records."""
+        url = "https://example.com/article"
+        manager.vector_database.generation = 0
+        
+        manager.store_content_from_url(url)
+        manager.vector_database.generation = 1
+        manager.store_content_from_url(url)
+        
+        assert manager.content_extractor.extract_from_url.call_count == 2
+        assert manager.vector_database.store.call_count == 2
+    
     def test_store_content_extraction_error(self, manager):
         """Test handling of content extraction errors."""
         manager.content_extractor.extract_from_url.return_value = {
@@ -155,30 +253,24 @@ class TestStoreContentFromText:
     """Test text content storage workflow."""
     
     @pytest.fixture
-    def manager(self):
+    def manager(self, patched_services):
         """Create ContentManager with mocked services."""
-        with patch('src.services.content_manager.ContentExtractor') as mock_extractor, \
-             patch('src.services.content_manager.EmbeddingService') as mock_embedding, \
-             patch('src.services.content_manager.CategorizationService') as mock_categorization, \
-             patch('src.services.content_manager.VectorDatabase') as mock_db, \
-             patch('src.services.content_manager.QuizService') as mock_quiz:
-            
-            manager = ContentManager(openai_api_key="test-key")
-            
-            manager.content_extractor.extract_from_text.return_value = {
-                'title': 'Extracted text',
-                'content': 'This is the cleaned text content.',
-                'metadata': {'type': 'text'}
-            }
-            
-            manager.embedding_service.generate_embedding.return_value = [0.1, 0.2, 0.3]
-            
-            manager.categorization_service.categorize_content.return_value = {
-                'category': 'Notes',
-                'summary': 'User notes'
-            }
-            
-            yield manager
+        manager = ContentManager(openai_api_key="test-key")
+        
+        manager.content_extractor.extract_from_text.return_value = {
+            'title': 'Extracted text',
+            'content': 'This is the cleaned text content.',
+            'metadata': {'type': 'text'}
+        }
+        
+        manager.embedding_service.generate_embedding.return_value = [0.1, 0.2, 0.3]
+        
+        manager.categorization_service.categorize_content.return_value = {
+            'category': 'Notes',
+            'summary': 'User notes'
+        }
+        
+        return manager
     
     def test_store_text_success(self, manager):
         """Test successful text storage."""
@@ -215,16 +307,29 @@ class TestBulkOperations:
     """Test bulk content storage operations."""
     
     @pytest.fixture
-    def manager(self):
+    def manager(self, patched_services):
         """Create ContentManager with mocked services."""
-        with patch('src.services.content_manager.ContentExtractor'), \
-             patch('src.services.content_manager.EmbeddingService'), \
-             patch('src.services.content_manager.CategorizationService'), \
-             patch('src.services.content_manager.VectorDatabase'), \
-             patch('src.services.content_manager.QuizService'):
-            
-            manager = ContentManager(openai_api_key="test-key")
-            yield manager
+        manager = ContentManager(openai_api_key="test-key")
+        
+        def extract(url):
+            if 'bad' in url:
+                return {'error': 'Request timed out'}
+            return {
+                'title': f'Article {url}',
+                'content': f'Content of {url}',
+                'url': url,
+                'metadata': {'author': 'Test Author'}
+            }
+        
+        manager.content_extractor.extract_from_url.side_effect = extract
+        manager.embedding_service.generate_embedding.side_effect = (
+            lambda texts: [[0.1, 0.2, 0.3] for _ in texts]
+        )
+        manager.categorization_service.categorize_content.return_value = {
+            'category': 'Technology',
+            'summary': 'This is a technology article'
+        }
+        return manager
     
     def test_store_bulk_urls_all_success(self, manager):
         """Test bulk URL storage with all successes."""
@@ -234,18 +339,60 @@ class TestBulkOperations:
             "https://example.com/3"
         ]
         
-        with patch.object(manager, 'store_content_from_url') as mock_store:
-            mock_record = Mock(spec=ContentRecord)
-            mock_record.content_id = uuid4()
-            mock_store.return_value = mock_record
-            
-            results = manager.store_bulk_urls(urls)
+        results = manager.store_bulk_urls(urls)
         
         assert results['total'] == 3
         assert results['success_count'] == 3
         assert results['failed_count'] == 0
         assert len(results['success']) == 3
         assert len(results['failed']) == 0
+        manager.vector_database.store.assert_not_called()
+        manager.vector_database.store_many.assert_called_once()
+        content_dicts, categories = manager.vector_database.store_many.call_args.args
+        assert [d['source_url'] for d in content_dicts] == urls
+        assert categories == ['Technology'] * 3
+    
+    def test_store_bulk_urls_deduplicates(self, manager):
+        """Test that a URL listed twice is fetched and stored once."""
+        urls = [
+            "https://example.com/1",
+            "https://example.com/2",
+            "https://example.com/1"
+        ]
+        
+        results = manager.store_bulk_urls(urls)
+        
+        assert results['total'] == 2
+        assert results['success_count'] == 2
+        assert manager.content_extractor.extract_from_url.call_count == 2
+        content_dicts, _ = manager.vector_database.store_many.call_args.args
+        assert [d['source_url'] for d in content_dicts] == urls[:2]
+    
+    def test_store_bulk_urls_batches_embeddings(self, manager):
+        """Test that all extracted pages are embedded in a single call."""
+        urls = ["https://example.com/1", "https://example.com/2"]
+        
+        manager.store_bulk_urls(urls)
+        
+        manager.embedding_service.generate_embedding.assert_called_once_with(
+            ["Content of https://example.com/1", "Content of https://example.com/2"]
+        )
+    
+    def test_store_bulk_urls_embeds_in_batches(self, manager):
+        """Test that large bulk requests are embedded one batch at a time."""
+        urls = [f"https://example.com/{i}" for i in range(5)]
+        
+        with patch('src.services.content_manager._BULK_BATCH_SIZE', 2):
+            results = manager.store_bulk_urls(urls)
+        
+        assert results['success_count'] == 5
+        batch_sizes = [len(c.args[0]) for c in manager.embedding_service.generate_embedding.call_args_list]
+        assert batch_sizes == [2, 2, 1]
+        stored_batches = [
+            [d['source_url'] for d in c.args[0]]
+            for c in manager.vector_database.store_many.call_args_list
+        ]
+        assert stored_batches == [urls[0:2], urls[2:4], urls[4:5]]
     
     def test_store_bulk_urls_partial_failure(self, manager):
         """Test bulk URL storage with partial failures."""
@@ -255,24 +402,15 @@ class TestBulkOperations:
             "https://example.com/3"
         ]
         
-        with patch.object(manager, 'store_content_from_url') as mock_store:
-            mock_record = Mock(spec=ContentRecord)
-            mock_record.content_id = uuid4()
-            
-            def side_effect(url, *args, **kwargs):
-                if 'bad' in url:
-                    raise ContentStorageException("Failed to store")
-                return mock_record
-            
-            mock_store.side_effect = side_effect
-            
-            results = manager.store_bulk_urls(urls)
+        results = manager.store_bulk_urls(urls)
         
         assert results['total'] == 3
         assert results['success_count'] == 2
         assert results['failed_count'] == 1
         assert len(results['success']) == 2
         assert len(results['failed']) == 1
+        assert results['failed'][0]['url'] == "https://example.com/bad"
+        assert "Content extraction failed" in results['failed'][0]['error']
     
     def test_store_bulk_urls_with_category_and_tags(self, manager):
         """Test bulk URL storage with category and tags."""
@@ -280,45 +418,40 @@ class TestBulkOperations:
         custom_category = "Technology"
         custom_tags = ["python", "ai"]
         
-        with patch.object(manager, 'store_content_from_url') as mock_store:
-            mock_record = Mock(spec=ContentRecord)
-            mock_record.content_id = uuid4()
-            mock_store.return_value = mock_record
-            
-            manager.store_bulk_urls(urls, custom_category, custom_tags)
-            
-            # Verify category and tags passed to each call (as positional args after url)
-            assert mock_store.call_count == 2
-            for call_obj in mock_store.call_args_list:
-                args, kwargs = call_obj
-                # Args are: (url, custom_category, custom_tags)
-                assert len(args) == 3
-                assert args[1] == custom_category
-                assert args[2] == custom_tags
+        manager.store_bulk_urls(urls, custom_category, custom_tags)
+        
+        # Verify category and tags were applied to every stored record
+        content_dicts, categories = manager.vector_database.store_many.call_args.args
+        assert len(content_dicts) == 2
+        assert categories == [custom_category] * 2
+        for content_dict in content_dicts:
+            assert content_dict['tags'] == custom_tags
 
 
 class TestContentRetrieval:
     """Test content retrieval workflows."""
     
     @pytest.fixture
-    def manager(self):
+    def manager(self, patched_services):
         """Create ContentManager with mocked services."""
-        with patch('src.services.content_manager.ContentExtractor'), \
-             patch('src.services.content_manager.EmbeddingService'), \
-             patch('src.services.content_manager.CategorizationService'), \
-             patch('src.services.content_manager.VectorDatabase'), \
-             patch('src.services.content_manager.QuizService'):
-            
-            manager = ContentManager(openai_api_key="test-key")
+        manager = ContentManager(openai_api_key="test-key")
 
-            manager.vector_database.get_by_category.return_value = {
-                'ids': [str(uuid4())],
-                'embeddings': [[0.1, 0.2]],
-                'documents': ["Sample document content"],
-                'metadatas': [{"title": "Sample Title", 'category': 'Technology'}],
-                'included': ['embeddings', 'documents', 'metadatas']
-            }
-            yield manager
+        manager.vector_database.get_by_category.return_value = {
+            'ids': [str(uuid4())],
+            'embeddings': [[0.1, 0.2]],
+            'documents': ["Sample document content"],
+            'metadatas': [{"title": "Sample Title", 'category': 'Technology'}],
+            'included': ['embeddings', 'documents', 'metadatas']
+        }
+        manager.vector_database.query_by_date_range.return_value = {
+            'ids': [str(uuid4())],
+            'embeddings': [[0.1, 0.2]],
+            'documents': ["Dated document content"],
+            'metadatas': [{"title": "Dated Title", 'category': 'Science', 'tags': 'physics,space',
+                           'timestamp': datetime(2025, 6, 1).timestamp()}],
+            'included': ['embeddings', 'documents', 'metadatas']
+        }
+        return manager
     
     def test_retrieve_by_category(self, manager):
         """Test that retrieve_by_category raises NotImplementedError."""
@@ -333,15 +466,45 @@ class TestContentRetrieval:
         assert result[0].title == 'Sample Title'
         assert result[0].original_content == 'Sample document content'
 
+    def test_retrieve_by_category_async(self, manager):
+        """Test that the async variant returns the same records."""
+        result = asyncio.run(manager.retrieve_content_by_category_async("Technology", limit=5))
 
+        manager.vector_database.get_by_category.assert_called_once_with("Technology", 5)
+        assert len(result) == 1
+        assert result[0].title == 'Sample Title'
     
-    def test_retrieve_by_date_range_not_implemented(self, manager):
-        """Test that retrieve_by_date_range raises NotImplementedError."""
+    def test_retrieve_by_date_range(self, manager):
+        """Test that retrieve_by_date_range returns ContentRecords."""
         start = datetime(2025, 1, 1)
         end = datetime(2025, 12, 31)
         
+        result = manager.retrieve_content_by_date_range(start, end, category="Science")
+
+        manager.vector_database.query_by_date_range.assert_called_once_with(start, end, category="Science")
+        assert isinstance(result[0], ContentRecord)
+        assert len(result) == 1
+        assert result[0].category == 'Science'
+        assert result[0].tags == ['physics', 'space']
+        assert result[0].timestamp == datetime(2025, 6, 1)
+
+    def test_retrieve_by_date_range_async(self, manager):
+        """Test that the async variant returns the same records."""
+        start = datetime(2025, 1, 1)
+        end = datetime(2025, 12, 31)
+
+        result = asyncio.run(manager.retrieve_content_by_date_range_async(start, end))
+
+        manager.vector_database.query_by_date_range.assert_called_once_with(start, end, category=None)
+        assert len(result) == 1
+        assert result[0].title == 'Dated Title'
+
+    def test_retrieve_by_date_range_wraps_errors(self, manager):
+        """Test that database failures surface as ContentRetrievalException."""
+        manager.vector_database.query_by_date_range.side_effect = RuntimeError("db down")
+
         with pytest.raises(ContentRetrievalException):
-            manager.retrieve_content_by_date_range(start, end)
+            manager.retrieve_content_by_date_range(datetime(2025, 1, 1), datetime(2025, 12, 31))
     
     def test_similarity_search_not_implemented(self, manager):
         """Test that similarity_search raises NotImplementedError."""
@@ -353,34 +516,24 @@ class TestQuizGeneration:
     """Test quiz generation workflows."""
     
     @pytest.fixture
-    def manager(self):
+    def manager(self, patched_services):
         """Create ContentManager with mocked services."""
-        with patch('src.services.content_manager.ContentExtractor'), \
-             patch('src.services.content_manager.EmbeddingService'), \
-             patch('src.services.content_manager.CategorizationService'), \
-             patch('src.services.content_manager.VectorDatabase'), \
-             patch('src.services.content_manager.QuizService'):
-            
-            manager = ContentManager(openai_api_key="test-key")
-            
-            # Mock content records
-            mock_records = [
-                Mock(spec=ContentRecord, summary="Summary 1"),
-                Mock(spec=ContentRecord, summary="Summary 2")
-            ]
-            
-            # Mock quiz
-            mock_quiz = Mock(spec=Quiz)
-            mock_quiz.questions = [
-                Mock(spec=QuizQuestion),
-                Mock(spec=QuizQuestion)
-            ]
-            
-            manager.quiz_service.generate_mcq_quiz.return_value = mock_quiz
-            manager.quiz_service.generate_fill_in_blank_quiz.return_value = mock_quiz
-            manager.quiz_service.generate_true_false_quiz.return_value = mock_quiz
-            
-            yield manager, mock_records, mock_quiz
+        manager = ContentManager(openai_api_key="test-key")
+        
+        # Mock content records
+        mock_records = [
+            SimpleNamespace(content_id=uuid4(), category="Technology", summary="Summary 1"),
+            SimpleNamespace(content_id=uuid4(), category="Technology", summary="Summary 2")
+        ]
+        
+        # Mock quiz
+        mock_quiz = FakeQuiz(questions=[FakeQuestion(), FakeQuestion()])
+        
+        manager.quiz_service.generate_mcq_quiz.return_value = mock_quiz
+        manager.quiz_service.generate_fill_in_blank_quiz.return_value = mock_quiz
+        manager.quiz_service.generate_true_false_quiz.return_value = mock_quiz
+        
+        return manager, mock_records, mock_quiz
     
     def test_generate_quiz_from_category_mcq(self, manager):
         """Test MCQ quiz generation from category."""
@@ -459,15 +612,9 @@ class TestStatistics:
     """Test statistics gathering."""
     
     @pytest.fixture
-    def manager(self):
+    def manager(self, patched_services):
         """Create ContentManager."""
-        with patch('src.services.content_manager.ContentExtractor'), \
-             patch('src.services.content_manager.EmbeddingService'), \
-             patch('src.services.content_manager.CategorizationService'), \
-             patch('src.services.content_manager.VectorDatabase'), \
-             patch('src.services.content_manager.QuizService'):
-            
-            yield ContentManager(openai_api_key="test-key")
+        return ContentManager(openai_api_key="test-key")
     
     def test_get_statistics(self, manager):
         """Test statistics retrieval."""
@@ -483,28 +630,23 @@ class TestErrorHandlingAndRetry:
     """Test error handling and retry logic."""
     
     @pytest.fixture
-    def manager(self):
+    def manager(self, patched_services):
         """Create ContentManager."""
-        with patch('src.services.content_manager.ContentExtractor'), \
-             patch('src.services.content_manager.EmbeddingService'), \
-             patch('src.services.content_manager.CategorizationService'), \
-             patch('src.services.content_manager.VectorDatabase'), \
-             patch('src.services.content_manager.QuizService'):
-            
-            manager = ContentManager(openai_api_key="test-key")
-            
-            manager.content_extractor.extract_from_url.return_value = {
-                'title': 'Test',
-                'content': 'Content',
-                'url': 'https://example.com'
-            }
-            manager.embedding_service.generate_embedding.return_value = [0.1, 0.2]
-            manager.categorization_service.categorize_content.return_value = {
-                'category': 'Test',
-                'summary': 'Summary'
-            }
-            
-            yield manager
+        
+        manager = ContentManager(openai_api_key="test-key")
+        
+        manager.content_extractor.extract_from_url.return_value = {
+            'title': 'Test',
+            'content': 'Content',
+            'url': 'https://example.com'
+        }
+        manager.embedding_service.generate_embedding.return_value = [0.1, 0.2]
+        manager.categorization_service.categorize_content.return_value = {
+            'category': 'Test',
+            'summary': 'Summary'
+        }
+        
+        return manager
     
     def test_error_handling_wraps_exceptions(self, manager):
         """Test that exceptions are properly wrapped in ContentStorageException."""
@@ -521,31 +663,26 @@ class TestErrorHandlingAndRetry:
 class TestIntegrationWorkflows:
     """Integration tests for complete workflows."""
     @pytest.fixture
-    def manager(self):
+    def manager(self, patched_services):
         """Create ContentManager."""
-        with patch('src.services.content_manager.ContentExtractor'), \
-             patch('src.services.content_manager.EmbeddingService'), \
-             patch('src.services.content_manager.CategorizationService'), \
-             patch('src.services.content_manager.VectorDatabase'), \
-             patch('src.services.content_manager.QuizService'):
-            
-            manager = ContentManager(openai_api_key="test-key")
-            
-            manager.content_extractor.extract_from_url.return_value = {
-                'title': 'Integration Test',
-                'content': 'Integration test content.',
-                'url': 'https://example.com'
-            }
-            manager.embedding_service.generate_embedding.return_value = [0.1, 0.2]
-            
-            mock_category_results = Mock(spec=CategoryResults, 
-                category='Test',
-                summary='Summary',
-                tags=["tag1", "tag2"],
-                confidence=0.95
-            )
-            manager.categorization_service.categorize_content.return_value = mock_category_results            
-            yield manager
+        
+        manager = ContentManager(openai_api_key="test-key")
+        
+        manager.content_extractor.extract_from_url.return_value = {
+            'title': 'Integration Test',
+            'content': 'Integration test content.',
+            'url': 'https://example.com'
+        }
+        manager.embedding_service.generate_embedding.return_value = [0.1, 0.2]
+        
+        mock_category_results = Mock(spec=CategoryResults, 
+            category='Test',
+            summary='Summary',
+            tags=["tag1", "tag2"],
+            confidence=0.95
+        )
+        manager.categorization_service.categorize_content.return_value = mock_category_results            
+        return manager
 
     
     def test_end_to_end_url_storage_workflow(self, manager, contentRecord):
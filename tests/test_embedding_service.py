@@ -1,16 +1,28 @@
 import pytest
 import torch
 import numpy as np
+from unittest.mock import patch
 from src.services.embedding_service import EmbeddingService, EmbeddingModels
 
+# Keep every embedding test on one worker so the session model loads only once
+pytestmark = [pytest.mark.slow, pytest.mark.xdist_group("embed")]
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def embedding_service():
-    """Fixture for creating an EmbeddingService instance."""
-    return EmbeddingService(EmbeddingModels.MINI_LM_L6_V2)
+    """Fixture for an EmbeddingService shared by the whole session, so the model loads once."""
+    service = EmbeddingService(EmbeddingModels.MINI_LM_L6_V2)
+    yield service
+    service.clear_model()
 
 
 @pytest.fixture
+def fresh_service():
+    """Fixture for a private EmbeddingService that a test may modify."""
+    return EmbeddingService(EmbeddingModels.MINI_LM_L6_V2)
+
+
+@pytest.fixture(scope="session")
 def sample_texts():
     """Fixture for sample texts."""
     return [
@@ -21,7 +33,7 @@ def sample_texts():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_embeddings(embedding_service, sample_texts):
     """Fixture for sample embeddings."""
     return embedding_service.generate_embedding(sample_texts)
@@ -71,6 +83,26 @@ class TestEmbeddingGeneration:
         similarity = embedding_service.cosine_similarity(emb1[0], emb2[0])
         assert similarity > 0.99
 
+    
+    def test_repeated_texts_are_served_from_cache(self, fresh_service):
+        """Test that identical texts are only encoded once."""
+        with patch.object(fresh_service.model, "encode", wraps=fresh_service.model.encode) as mock_encode:
+            first = fresh_service.generate_embedding(["alpha", "beta"])
+            second = fresh_service.generate_embedding(["beta", "alpha", "gamma"])
+        
+        encoded = [list(c.args[0]) for c in mock_encode.call_args_list]
+        assert encoded == [["alpha", "beta"], ["gamma"]]
+        assert np.allclose(second[0], first[1])
+        assert np.allclose(second[1], first[0])
+    
+    def test_cache_can_be_bypassed(self, fresh_service):
+        """Test that use_cache=False always calls the model."""
+        fresh_service.generate_embedding(["alpha"])
+        
+        with patch.object(fresh_service.model, "encode", wraps=fresh_service.model.encode) as mock_encode:
+            fresh_service.generate_embedding(["alpha"], use_cache=False)
+        
+        mock_encode.assert_called_once()
 
 class TestCosineSimilarity:
     """Test cosine similarity calculations."""
@@ -112,6 +144,13 @@ class TestCosineSimilarity:
         similarity = embedding_service.cosine_similarity(emb1, emb2)
         
         assert abs(similarity - 1.0) < 0.001
+        
+    def test_cosine_similarity_rejects_mismatched_shapes(self, embedding_service):
+        """Test that matrices and vectors of different lengths are rejected, not flattened."""
+        with pytest.raises(ValueError):
+            embedding_service.cosine_similarity([[0.1, 0.2], [0.3, 0.4]], [0.1, 0.2, 0.3, 0.4])
+        with pytest.raises(ValueError):
+            embedding_service.cosine_similarity([0.1, 0.2, 0.3], [0.1, 0.2])
 
 
 class TestSimilarityMatrix:
@@ -125,8 +164,7 @@ class TestSimilarityMatrix:
         assert sim_matrix.shape[1] == len(sample_embeddings)
         
         # Diagonal should be 1.0 (identical to self)
-        for i in range(len(sample_embeddings)):
-            assert abs(sim_matrix[i][i].item() - 1.0) < 0.001
+        assert torch.allclose(torch.diagonal(sim_matrix), torch.ones(sim_matrix.shape[0]), atol=1e-3)
             
     def test_similarity_matrix_rectangular(self, embedding_service):
         """Test computing similarity matrix between two different sets."""
@@ -145,18 +183,15 @@ class TestSimilarityMatrix:
         """Test that similarity matrix is symmetric."""
         sim_matrix = embedding_service.similarity_matrix(sample_embeddings)
         
-        n = sim_matrix.shape[0]
-        for i in range(n):
-            for j in range(i + 1, n):
-                assert abs(sim_matrix[i][j] - sim_matrix[j][i]) < 0.001
+        assert torch.allclose(sim_matrix, sim_matrix.T, atol=1e-3)
 
 
 class TestFindMostSimilar:
     """Test finding most similar embeddings."""
     
-    def test_find_most_similar_basic(self, embedding_service, sample_texts):
+    def test_find_most_similar_basic(self, embedding_service, sample_embeddings):
         """Test finding most similar texts."""
-        corpus_embeddings = embedding_service.generate_embedding(sample_texts)
+        corpus_embeddings = sample_embeddings
         query_embedding = embedding_service.generate_embedding(["Python programming"])[0]
         
         results = embedding_service.find_most_similar(query_embedding, corpus_embeddings, top_k=2)
@@ -167,9 +202,9 @@ class TestFindMostSimilar:
         # Scores should be in descending order
         assert results[0][1] >= results[1][1]
         
-    def test_find_most_similar_with_threshold(self, embedding_service, sample_texts):
+    def test_find_most_similar_with_threshold(self, embedding_service, sample_embeddings):
         """Test finding similar texts with threshold."""
-        corpus_embeddings = embedding_service.generate_embedding(sample_texts)
+        corpus_embeddings = sample_embeddings
         query_embedding = embedding_service.generate_embedding(["Pets"])[0]
         
         results = embedding_service.find_most_similar(
@@ -197,9 +232,9 @@ class TestFindMostSimilar:
 class TestSemanticSearch:
     """Test semantic search functionality."""
     
-    def test_semantic_search_basic(self, embedding_service, sample_texts):
+    def test_semantic_search_basic(self, embedding_service, sample_embeddings):
         """Test basic semantic search."""
-        corpus_embeddings = embedding_service.generate_embedding(sample_texts)
+        corpus_embeddings = sample_embeddings
         
         results = embedding_service.semantic_search(
             "programming languages",
@@ -211,9 +246,9 @@ class TestSemanticSearch:
         # Top results should be about programming languages
         assert results[0][0] in [0, 1]
         
-    def test_semantic_search_with_threshold(self, embedding_service, sample_texts):
+    def test_semantic_search_with_threshold(self, embedding_service, sample_embeddings):
         """Test semantic search with minimum threshold."""
-        corpus_embeddings = embedding_service.generate_embedding(sample_texts)
+        corpus_embeddings = sample_embeddings
         
         results = embedding_service.semantic_search(
             "animals",
@@ -230,9 +265,9 @@ class TestSemanticSearch:
 class TestBatchSemanticSearch:
     """Test batch semantic search functionality."""
     
-    def test_batch_semantic_search(self, embedding_service, sample_texts):
+    def test_batch_semantic_search(self, embedding_service, sample_embeddings):
         """Test searching with multiple queries."""
-        corpus_embeddings = embedding_service.generate_embedding(sample_texts)
+        corpus_embeddings = sample_embeddings
         
         queries = ["programming", "animals"]
         results = embedding_service.batch_semantic_search(
@@ -246,6 +281,23 @@ class TestBatchSemanticSearch:
         for query_results in results:
             assert len(query_results) == 2
             
+    def test_batch_semantic_search_matches_single_search(self, embedding_service, sample_texts, sample_embeddings):
+        """Test that batched search returns the same hits as one search per query."""
+        queries = ["programming", "animals"]
+        
+        batch_results = embedding_service.batch_semantic_search(
+            queries,
+            sample_embeddings,
+            top_k=3,
+            threshold=0.1
+        )
+        
+        for query, query_results in zip(queries, batch_results):
+            expected = embedding_service.semantic_search(query, sample_embeddings, top_k=3, threshold=0.1)
+            assert [idx for idx, _ in query_results] == [idx for idx, _ in expected]
+            for (_, score), (_, expected_score) in zip(query_results, expected):
+                assert abs(score - expected_score) < 1e-5
+            
     def test_batch_semantic_search_empty_queries(self, embedding_service, sample_embeddings):
         """Test batch search with empty query list."""
         results = embedding_service.batch_semantic_search(
@@ -355,9 +407,9 @@ class TestClusterEmbeddings:
         for indices in clusters.values():
             assert len(indices) >= min_size
             
-    def test_cluster_embeddings_high_threshold(self, embedding_service, sample_texts):
+    def test_cluster_embeddings_high_threshold(self, embedding_service, sample_embeddings):
         """Test clustering with high threshold (strict)."""
-        embeddings = embedding_service.generate_embedding(sample_texts)
+        embeddings = sample_embeddings
         
         # With very high threshold, should get fewer/smaller clusters
         clusters_strict = embedding_service.cluster_embeddings(
@@ -380,16 +432,29 @@ class TestClusterEmbeddings:
 class TestModelManagement:
     """Test model management functionality."""
     
-    def test_clear_model(self, embedding_service):
+    def test_clear_model(self, fresh_service):
         """Test clearing model from memory."""
         # Model should be loaded
-        assert embedding_service.model is not None
+        assert fresh_service.model is not None
         
         # Clear the model
-        embedding_service.clear_model()
+        fresh_service.clear_model()
         
         # Model should be None
-        assert embedding_service.model is None
+        assert fresh_service.model is None
+        
+    @pytest.mark.slow
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+    def test_clear_model_releases_gpu_memory(self):
+        """Test that loading and clearing models does not accumulate GPU memory."""
+        baseline = torch.cuda.memory_allocated()
+        
+        for model_name in EmbeddingModels:
+            service = EmbeddingService(model_name, compile_model=False)
+            service.clear_model()
+        
+        # Allow a little slack for allocator bookkeeping
+        assert torch.cuda.memory_allocated() - baseline < 16 * 1024 * 1024
         
     def test_model_caching(self):
         """Test that model is cached and reused."""
@@ -11,74 +11,45 @@ from src.utils.logging_config import setup_logging
 class TestValidators:
     """Tests for the validators module."""
     
-    def test_validate_url_valid_http(self):
-        """Test URL validation with valid HTTP URL."""
-        assert validate_url("http://example.com") is True
-    
-    def test_validate_url_valid_https(self):
-        """Test URL validation with valid HTTPS URL."""
-        assert validate_url("https://example.com") is True
-    
-    def test_validate_url_invalid_no_protocol(self):
-        """Test URL validation with no protocol."""
-        assert validate_url("example.com") is False
-    
-    def test_validate_url_invalid_wrong_protocol(self):
-        """Test URL validation with wrong protocol."""
-        assert validate_url("ftp://example.com") is False
-    
-    def test_validate_url_empty_string(self):
-        """Test URL validation with empty string."""
-        assert validate_url("") is False
-    
-    def test_validate_url_none(self):
-        """Test URL validation with None raises TypeError."""
-        with pytest.raises(AttributeError):
-            validate_url(None)
+    @pytest.mark.parametrize("url,expected", [
+        ("http://example.com", True),
+        ("https://example.com", True),
+        ("example.com", False),
+        ("ftp://example.com", False),
+        ("", False),
+        (None, False),
+    ], ids=["valid-http", "valid-https", "no-protocol", "wrong-protocol", "empty-string", "none"])
+    def test_validate_url(self, url, expected):
+        """Test URL validation across valid, invalid and non-string inputs."""
+        assert validate_url(url) is expected
+
+
+class CustomError(Exception):
+    pass
 
 
 class TestErrorHandler:
     """Tests for the ErrorHandler class."""
     
-    def test_handle_error_with_string_error(self):
-        """Test error handling with string error."""
-        error = "Test error message"
-        result = ErrorHandler.handle_error(error)
-        assert result == {"error": "Test error message"}
-    
-    def test_handle_error_with_exception(self):
-        """Test error handling with Exception object."""
-        error = ValueError("Invalid value")
-        result = ErrorHandler.handle_error(error)
-        assert result == {"error": "Invalid value"}
-    
-    def test_handle_error_with_custom_exception(self):
-        """Test error handling with custom exception."""
-        class CustomError(Exception):
-            pass
-        
-        error = CustomError("Custom error message")
-        result = ErrorHandler.handle_error(error)
-        assert result == {"error": "Custom error message"}
-    
-    def test_handle_error_with_none(self):
-        """Test error handling with None."""
-        result = ErrorHandler.handle_error(None)
-        assert result == {"error": "None"}
+    @pytest.mark.parametrize("error,expected", [
+        ("Test error message", "Test error message"),
+        (ValueError("Invalid value"), "Invalid value"),
+        (CustomError("Custom error message"), "Custom error message"),
+        (None, "None"),
+    ], ids=["string", "exception", "custom-exception", "none"])
+    def test_handle_error(self, error, expected):
+        """Test error handling with strings, exceptions and None."""
+        assert ErrorHandler.handle_error(error) == {"error": expected}
 
 
 class TestLoggingConfig:
     """Tests for the logging_config module."""
     
+    @pytest.mark.parametrize("calls", [1, 2, 3])
     @patch('src.utils.logging_config.logging.basicConfig')
-    def test_setup_logging(self, mock_basic_config):
-        """Test that setup_logging configures logging correctly."""
-        setup_logging()
-        mock_basic_config.assert_called_once_with(level=logging.INFO)
-    
-    @patch('src.utils.logging_config.logging.basicConfig')
-    def test_setup_logging_called_multiple_times(self, mock_basic_config):
-        """Test that setup_logging can be called multiple times."""
-        setup_logging()
-        setup_logging()
-        assert mock_basic_config.call_count == 2
+    def test_setup_logging(self, mock_basic_config, calls):
+        """Test that setup_logging configures logging on every call."""
+        for _ in range(calls):
+            setup_logging()
+        assert mock_basic_config.call_count == calls
+        mock_basic_config.assert_called_with(level=logging.INFO)
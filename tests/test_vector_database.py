@@ -1,17 +1,37 @@
+import hashlib
+import numpy as np
 import pytest
+from unittest.mock import patch
+from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
 from src.services.vector_database import VectorDatabase
-import tempfile
-import shutil
 from datetime import datetime, timedelta
 
-@pytest.fixture
-def temp_db():
-    temp_dir = tempfile.mkdtemp()
-    db = VectorDatabase(persist_directory=temp_dir)
+pytestmark = pytest.mark.slow
+
+def _fake_embed(self, input):
+    # Deterministic 8-d vectors keyed on the text; distinct texts get distinct vectors
+    return [
+        np.frombuffer(hashlib.blake2b(text.encode(), digest_size=8).digest(), dtype=np.uint8).astype(np.float32) + 1
+        for text in input
+    ]
+
+@pytest.fixture(scope="module", autouse=True)
+def _stub_embedding_function():
+    # Exercise storage and retrieval without downloading or running the ONNX model
+    with patch.object(DefaultEmbeddingFunction, "__call__", _fake_embed):
+        yield
+
+@pytest.fixture(scope="session")
+def _shared_db():
+    db = VectorDatabase(in_memory=True)
     yield db
-    if hasattr(db, "close") and callable(db.close):
-        db.close()
-    shutil.rmtree(temp_dir)
+    db.close()
+
+@pytest.fixture
+def temp_db(_shared_db):
+    # One client per session; each test starts from an empty collection
+    yield _shared_db
+    _shared_db.reset()
 
 def test_store_and_retrieve(temp_db):
     content = {
@@ -27,16 +47,86 @@ def test_store_and_retrieve(temp_db):
     results = temp_db.get_by_category("Education")
     assert len(results['ids']) > 0
 
+def test_in_memory_instances_are_isolated():
+    first = VectorDatabase(in_memory=True)
+    second = VectorDatabase(in_memory=True)
+    first.store({"content": "Only here", "title": "A", "tags": []}, "Cat")
+    assert first.collection.count() == 1
+    assert second.collection.count() == 0
+
+    second.reset()
+    assert first.collection.count() == 1
+    first.close()
+    second.close()
+
+def test_persists_across_instances(tmp_path):
+    db = VectorDatabase(persist_directory=str(tmp_path))
+    doc_id = db.store({"content": "Kept", "title": "Kept", "tags": []}, "Disk")
+    db.close()
+
+    reopened = VectorDatabase(persist_directory=str(tmp_path))
+    assert reopened.collection.get(ids=[doc_id])['ids'] == [doc_id]
+    reopened.close()
+
+def test_store_many(temp_db):
+    doc_ids = temp_db.store_many(
+        [
+            {"content": "First", "title": "Doc1", "tags": ["a"]},
+            {"content": "Second", "title": "Doc2", "tags": ["b"]},
+        ],
+        ["Tech", "Science"],
+    )
+    assert len(doc_ids) == 2
+    assert len(set(doc_ids)) == 2
+    assert temp_db.get_all_categories() == ["Science", "Tech"]
+
+    results = temp_db.get_by_category("Tech")
+    assert results['ids'] == [doc_ids[0]]
+
+def test_store_many_orders_timestamps(temp_db):
+    first_id = temp_db.store({"content": "Before", "title": "Before", "tags": []}, "Test")
+    doc_ids = temp_db.store_many(
+        [{"content": f"Content {i}", "title": f"Doc{i}", "tags": []} for i in range(3)],
+        ["Test"] * 3,
+    )
+    ids = [first_id] + doc_ids
+    metadatas = temp_db.collection.get(ids=ids, include=["metadatas"])
+    timestamps = dict(zip(metadatas['ids'], (m['timestamp'] for m in metadatas['metadatas'])))
+    ordered = [timestamps[doc_id] for doc_id in ids]
+    # Strictly increasing in write order, even within one batch
+    assert ordered == sorted(set(ordered))
+
+def test_reset_clears_content(temp_db):
+    temp_db.store({"content": "A", "title": "A", "tags": ["tag1"]}, "Cat1")
+    assert temp_db.get_all_categories() == ["Cat1"]
+
+    generation = temp_db.generation
+    temp_db.reset()
+    assert temp_db.generation == generation + 1
+    assert temp_db.collection.count() == 0
+    assert temp_db.get_all_categories() == []
+    assert temp_db.get_all_tags() == []
+
 def test_similarity_search(temp_db):
-    temp_db.store({"content": "First", "title": "Doc1", "tags": []}, "Tech")
-    temp_db.store({"content": "Second", "title": "Doc2", "tags": []}, "Tech")
+    temp_db.store_many(
+        [
+            {"content": "First", "title": "Doc1", "tags": []},
+            {"content": "Second", "title": "Doc2", "tags": []},
+        ],
+        ["Tech", "Tech"],
+    )
     
     results = temp_db.similarity_search(query_texts=["First"], k=2)
     assert len(results['ids'][0]) == 2
 
 def test_get_categories(temp_db):
-    temp_db.store({"content": "A", "title": "A", "tags": []}, "Cat1")
-    temp_db.store({"content": "B", "title": "B", "tags": []}, "Cat2")
+    temp_db.store_many(
+        [
+            {"content": "A", "title": "A", "tags": []},
+            {"content": "B", "title": "B", "tags": []},
+        ],
+        ["Cat1", "Cat2"],
+    )
     
     categories = temp_db.get_all_categories()
     assert "Cat1" in categories
@@ -49,6 +139,22 @@ def test_get_tags(temp_db):
     assert "tag1" in tags
     assert "tag2" in tags
 
+def test_facets_scan_every_batch(temp_db):
+    temp_db.store_many(
+        [{"content": f"Content {i}", "title": f"Doc{i}", "tags": [f"tag{i}"]} for i in range(5)],
+        [f"Cat{i}" for i in range(5)],
+    )
+    assert temp_db.get_all_categories(batch_size=2) == [f"Cat{i}" for i in range(5)]
+
+def test_facets_refresh_after_store(temp_db):
+    temp_db.store({"content": "A", "title": "A", "tags": ["tag1"]}, "Cat1")
+    assert temp_db.get_all_categories() == ["Cat1"]
+    assert temp_db.get_all_tags() == ["tag1"]
+
+    temp_db.store({"content": "B", "title": "B", "tags": ["tag2"]}, "Cat2")
+    assert temp_db.get_all_categories() == ["Cat1", "Cat2"]
+    assert temp_db.get_all_tags() == ["tag1", "tag2"]
+
 def test_query_by_date_range(temp_db):
     """Test querying content by date range."""
     # Store some content
@@ -63,6 +169,59 @@ def test_query_by_date_range(temp_db):
     assert 'ids' in results
     assert len(results['ids']) > 0
 
+def test_query_by_date_range_with_cursor(temp_db):
+    """Test paging through a date range with a keyset cursor."""
+    temp_db.store_many(
+        [{"content": f"Content {i}", "title": f"Doc{i}", "tags": []} for i in range(5)],
+        ["Test"] * 5,
+    )
+
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=1)
+
+    seen_ids = []
+    cursor = None
+    while True:
+        results = temp_db.query_by_date_range(start_date=start_date, end_date=end_date, k=2, cursor=cursor)
+        if not results['ids']:
+            break
+        seen_ids.extend(results['ids'])
+        cursor = (results['metadatas'][-1]['timestamp'], results['ids'][-1])
+
+    assert len(seen_ids) == 5
+    assert len(set(seen_ids)) == 5
+
+def test_query_by_date_range_cursor_handles_unordered_storage(temp_db):
+    """Test that paging returns every row once even when storage order differs from key order."""
+    timestamp = datetime.now().timestamp()
+    # Ties inserted in descending id order, a lagging writer's earlier row stored last,
+    # and a legacy dashed id without the newer metadata fields
+    rows = [
+        ("ffffffff000000000000000000000003", timestamp),
+        ("ffffffff000000000000000000000002", timestamp),
+        ("00000000000000000000000000000001", timestamp),
+        ("85413a97-21ab-4c1e-9d2f-000000000000", timestamp),
+        ("eeeeeeee000000000000000000000000", timestamp - 0.5),
+    ]
+    temp_db.collection.add(
+        documents=[f"Content {i}" for i in range(len(rows))],
+        metadatas=[{"title": f"Doc{i}", "category": "Test", "timestamp": ts} for i, (_, ts) in enumerate(rows)],
+        ids=[doc_id for doc_id, _ in rows]
+    )
+
+    start_date = datetime.fromtimestamp(timestamp - 1)
+    end_date = datetime.fromtimestamp(timestamp + 1)
+    seen_ids = []
+    cursor = None
+    while True:
+        results = temp_db.query_by_date_range(start_date=start_date, end_date=end_date, k=2, cursor=cursor)
+        if not results['ids']:
+            break
+        seen_ids.extend(results['ids'])
+        cursor = (results['metadatas'][-1]['timestamp'], results['ids'][-1])
+
+    assert seen_ids == [doc_id for _, doc_id in sorted((ts, doc_id) for doc_id, ts in rows)]
+
 def test_query_by_date_range_no_results(temp_db):
     """Test querying with date range that returns no results."""
     # Query for content from a future date range